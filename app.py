@@ -31,7 +31,9 @@ def health_check():
             'Human-like behavior simulation',
             'Realistic mouse movements',
             'Anti-automation measures',
-            'Visible browser mode'
+            'Visible browser mode',
+            'Vector PDF export with selectable text (options.vector_pdf)',
+            'Smaller screen-preview PDFs (options.preview)'
         ]
     })
 
@@ -84,7 +86,15 @@ def download_presentation():
         logger.info(f"Stealth approach - max_slides: {max_slides}, timeout: {TIMEOUT}s")
         
         # Create stealth downloader
-        downloader = StealthPitchDownloader(max_slides=max_slides, timeout=TIMEOUT)
+        downloader = StealthPitchDownloader(
+            max_slides=max_slides,
+            timeout=TIMEOUT,
+            # Only a JSON true turns a mode on; bool() would accept strings like "false"
+            vector_pdf=options.get('vector_pdf') is True,
+            preview=options.get('preview') is True,
+            # Other formats only return the download URL, so skip encoding the PDF
+            inline_base64=(format_type == 'base64')
+        )
         
         # Run download synchronously (no event loop issues)
         result = downloader.download_presentation(url, filename)
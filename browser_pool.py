@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Shared browser pool for the Pitch.com Downloader API
+"""
+
+import asyncio
+import atexit
+import contextlib
+import logging
+import threading
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from pyppeteer import launch
+
+logger = logging.getLogger(__name__)
+
+class BrowserPool:
+    """
+    Keeps one headless browser and up to `size` configured pages alive across downloads.
+    A page is closed and replaced after `max_page_uses` downloads so that memory held by
+    long-lived renderers is returned. Short-lived extra tabs opened through tab() are
+    capped at `max_tabs` across all downloads, which bounds the renderer processes.
+
+    The browser is bound to the event loop that launched it, so the pool runs its own
+    loop on a daemon thread and callers submit coroutines through run(). The loop is
+    started lazily, which keeps it out of the gunicorn master when the app is preloaded.
+    """
+
+    def __init__(self, launch_options: Dict, page_setup: Callable[..., Awaitable], size: int = 1,
+                 max_page_uses: int = 50, max_tabs: int = 5):
+        self.launch_options = launch_options
+        self.page_setup = page_setup
+        self.size = max(1, size)
+        self.max_page_uses = max(1, max_page_uses)
+        self.max_tabs = max(1, max_tabs)
+        self.loop = None
+        self.browser = None
+        self._instances = None  # asyncio.Queue of idle pages, created on the pool loop
+        self._waiting = 0  # acquire() calls blocked on the queue
+        self._created = 0
+        self._uses = {}  # page -> downloads served
+        self._launch_lock = None
+        self._tab_slots = None  # asyncio.Semaphore bounding tab(), created on the pool loop
+        self._thread = None
+        self._thread_lock = threading.Lock()
+
+    def start(self) -> asyncio.AbstractEventLoop:
+        """Start the pool event loop thread if it is not running yet"""
+        with self._thread_lock:
+            if self.loop is None or self.loop.is_closed():
+                self.loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self.loop.run_forever, name='browser-pool', daemon=True
+                )
+                self._thread.start()
+                atexit.register(self.close)
+        return self.loop
+
+    def run(self, coro, timeout: Optional[float] = None):
+        """
+        Run a coroutine on the pool loop and block until it finishes. After timeout
+        seconds the coroutine is cancelled and TimeoutError raised
+        """
+        future = asyncio.run_coroutine_threadsafe(coro, self.start())
+        try:
+            return future.result(timeout)
+        except TimeoutError:
+            future.cancel()
+            raise
+
+    def _is_connected(self) -> bool:
+        return bool(self.browser and self.browser._connection._connected)
+
+    async def _ensure_browser(self):
+        if self._launch_lock is None:
+            self._launch_lock = asyncio.Lock()
+
+        async with self._launch_lock:
+            if not self._is_connected():
+                if self.browser:
+                    logger.warning("Pooled browser disconnected, relaunching")
+                logger.info("Launching pooled browser...")
+                # pyppeteer's own atexit hook would call run_until_complete on this
+                # always-running loop and fail, so close() shuts the browser down instead
+                self.browser = await launch({**self.launch_options, 'autoClose': False})
+                if self._instances is None:
+                    self._instances = asyncio.Queue()
+                else:
+                    # Idle pages died with the old browser. Acquirers blocked on the queue
+                    # get a None each and start over against the new browser
+                    while not self._instances.empty():
+                        self._instances.get_nowait()
+                    for _ in range(self._waiting):
+                        self._instances.put_nowait(None)
+                self._created = 0
+                self._uses = {}
+                # The first acquire opens its own page; warm the rest for concurrent requests
+                for _ in range(self.size - 1):
+                    asyncio.ensure_future(self._warm_page(self.browser))
+
+        return self.browser
+
+    async def _warm_page(self, browser):
+        """Open and configure an idle page ahead of demand"""
+        self._created += 1
+        try:
+            page = await browser.newPage()
+            await self.page_setup(page)
+        except Exception as e:
+            if browser is self.browser:
+                self._created -= 1
+                self._wake_waiter()
+            logger.warning(f"Could not pre-warm pooled page: {e}")
+            return
+
+        if browser is self.browser:
+            self._instances.put_nowait(page)
+
+    async def acquire(self) -> Tuple[object, object]:
+        """Return (browser, page), opening a new page while the pool is below size"""
+        while True:
+            browser = await self._ensure_browser()
+            if self._instances.empty() and self._created < self.size:
+                self._created += 1
+                try:
+                    page = await browser.newPage()
+                    await self.page_setup(page)
+                except Exception:
+                    self._created -= 1
+                    raise
+                self._uses[page] = 1
+                return browser, page
+
+            self._waiting += 1
+            try:
+                page = await self._instances.get()
+            finally:
+                self._waiting -= 1
+            if page is None:
+                continue
+            if not page.isClosed():
+                self._uses[page] = self._uses.get(page, 0) + 1
+                return self.browser, page
+
+            # A closed page frees its slot for a fresh one
+            self._uses.pop(page, None)
+            self._created -= 1
+
+    async def release(self, page: Optional[object]):
+        """Reset a page to about:blank and return it to the pool"""
+        if page is None or self._instances is None or page.browser is not self.browser:
+            return
+
+        if self._uses.get(page, 0) >= self.max_page_uses:
+            logger.info("Recycling pooled page after %d uses", self._uses[page])
+            await self._discard(page)
+            return
+
+        try:
+            await page.goto('about:blank')
+            self._instances.put_nowait(page)
+        except Exception as e:
+            logger.warning(f"Discarding pooled page: {e}")
+            await self._discard(page)
+
+    @contextlib.asynccontextmanager
+    async def tab(self):
+        """Open a configured extra page, waiting while max_tabs of them are open, and close it on exit"""
+        if self._tab_slots is None:
+            self._tab_slots = asyncio.Semaphore(self.max_tabs)
+
+        async with self._tab_slots:
+            browser = await self._ensure_browser()
+            page = await browser.newPage()
+            try:
+                await self.page_setup(page)
+                yield page
+            finally:
+                try:
+                    await page.close()
+                except Exception:
+                    pass
+
+    async def _discard(self, page):
+        """Close a page and warm a replacement so acquirers waiting on the queue are served"""
+        self._uses.pop(page, None)
+        self._created -= 1
+        try:
+            await page.close()
+        except Exception:
+            pass
+
+        if self._is_connected():
+            asyncio.ensure_future(self._warm_page(self.browser))
+        else:
+            self._wake_waiter()
+
+    def _wake_waiter(self):
+        """Wake one acquirer blocked on the queue so it sees the freed slot and opens a page itself"""
+        if self._waiting and self._instances is not None:
+            self._instances.put_nowait(None)
+
+    def close(self, timeout: float = 10):
+        """Close the pooled browser and stop the pool loop"""
+        with self._thread_lock:
+            if self.loop is None or self.loop.is_closed() or not self._thread.is_alive():
+                return
+
+            if self.browser:
+                try:
+                    asyncio.run_coroutine_threadsafe(self.browser.close(), self.loop).result(timeout)
+                except Exception as e:
+                    logger.warning(f"Error closing pooled browser: {e}")
+                self.browser = None
+
+            # Loop-bound state is rebuilt if the pool is started again
+            self._instances = None
+            self._launch_lock = None
+            self._tab_slots = None
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join(timeout)
+            self.loop.close()
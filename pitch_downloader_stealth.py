@@ -1,191 +1,515 @@
 import asyncio
 import base64
 import logging
+import mmap
 import os
-import tempfile
+import signal
+import threading
 import uuid
 import random
 import time
-from typing import Dict, List, Optional
-from pyppeteer import launch
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import landscape, letter
-from PIL import Image
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Callable, Dict, List, Optional
+from pyppeteer.errors import PyppeteerError, TimeoutError as PyppeteerTimeoutError
 import io
+from browser_pool import BrowserPool
+from utils import (
+    DUPLICATE_SLIDE_MAX_PIXELS, PdfImageWriter, embeddable_image, get_presentation_title_from_url,
+    image_thumbnail, parse_slide_total, sanitize_filename, thumbnail_difference
+)
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Requests that never contribute to the rendered slide canvas, blocked inside the
+# browser with Network.setBlockedURLs. Fonts are left alone because slides render
+# with them; media is matched by file extension
+BLOCKED_MEDIA_EXTENSIONS = ('.mp4', '.webm', '.mov', '.m3u8', '.mp3', '.wav', '.ogg')
+BLOCKED_URL_PATTERNS = (
+    'analytics',
+    'segment.io',
+    'segment.com',
+    'doubleclick',
+    'google-analytics',
+    'googletagmanager',
+    'hotjar',
+    'facebook.net',
+    'intercom',
+    'sentry.io',
+    'fullstory',
+    'mixpanel',
+    'amplitude.com',
+    'clarity.ms'
+)
+BLOCKED_URLS = [f'*{pattern}*' for pattern in BLOCKED_URL_PATTERNS + BLOCKED_MEDIA_EXTENSIONS]
+
+# Installed on every new document: counts slide changes in window.__slideIdx,
+# tracks loading indicators and placeholders in window.__loadingCount and
+# window.__placeholderCount as nodes come and go, and keeps window.__ready true
+# while slide content shows no loading indicators. window.__mutationCount and
+# window.__lastMutationAt record DOM activity for decks without a slide counter.
+# Only added subtrees are scanned.
+PAGE_OBSERVER_JS = '''() => {
+    window.__slideIdx = 0;
+    window.__mutationCount = 0;
+    window.__lastMutationAt = 0;
+    window.__loadingCount = 0;
+    window.__placeholderCount = 0;
+    window.__ready = false;
+    const LOADING_RE = /loading|spinner|loader|skeleton/;
+    const LOADING_SELECTOR = '[class*="loading"], [class*="spinner"], [class*="loader"], [class*="skeleton"]';
+    const PLACEHOLDER_RE = /placeholder/;
+    const PLACEHOLDER_SELECTOR = '[class*="placeholder"]';
+    const SLIDE_SELECTOR = '[class*="slide"], [class*="presentation"]';
+    const loaders = new Set();
+    const placeholders = new Set();
+    let lastCounter = null;
+    let counter = null;
+    let slide = null;
+    let textLength = 0;
+    let textLengthAt = -1;
+    
+    // Length of the main content text, re-read only after the DOM has changed
+    window.__textLength = () => {
+        if (textLengthAt !== window.__mutationCount) {
+            textLengthAt = window.__mutationCount;
+            const root = document.querySelector('main, [role="main"]') || document.body;
+            textLength = root ? root.textContent.trim().length : 0;
+        }
+        return textLength;
+    };
+    
+    const track = (el) => {
+        const className = el.getAttribute('class') || '';
+        if (LOADING_RE.test(className)) loaders.add(el); else loaders.delete(el);
+        if (PLACEHOLDER_RE.test(className)) placeholders.add(el); else placeholders.delete(el);
+    };
+    
+    const scan = (node) => {
+        if (node.nodeType !== 1) return;
+        track(node);
+        node.querySelectorAll(LOADING_SELECTOR).forEach(el => loaders.add(el));
+        node.querySelectorAll(PLACEHOLDER_SELECTOR).forEach(el => placeholders.add(el));
+        if (!slide) {
+            slide = node.matches(SLIDE_SELECTOR) ? node : node.querySelector(SLIDE_SELECTOR);
+        }
+    };
+    
+    const update = (mutations) => {
+        window.__mutationCount += 1;
+        window.__lastMutationAt = performance.now();
+        let removed = false;
+        for (const mutation of mutations) {
+            if (mutation.type === 'childList') {
+                mutation.addedNodes.forEach(scan);
+                removed = removed || mutation.removedNodes.length > 0;
+            } else if (mutation.type === 'attributes') {
+                track(mutation.target);
+                if (!slide && mutation.target.matches(SLIDE_SELECTOR)) slide = mutation.target;
+            }
+        }
+        if (removed) {
+            loaders.forEach(el => { if (!el.isConnected) loaders.delete(el); });
+            placeholders.forEach(el => { if (!el.isConnected) placeholders.delete(el); });
+            // Only a detached slide needs a document-wide lookup
+            if (slide && !slide.isConnected) slide = document.querySelector(SLIDE_SELECTOR);
+        }
+        window.__loadingCount = loaders.size;
+        window.__placeholderCount = placeholders.size;
+        
+        // The counter node is reused until the player replaces it
+        if (!counter || !counter.isConnected) {
+            counter = document.querySelector('.player-v2-chrome-controls-slide-count');
+        }
+        const text = counter ? counter.textContent : null;
+        if (text && text !== lastCounter) {
+            lastCounter = text;
+            window.__slideIdx += 1;
+        }
+        
+        window.__ready = window.__loadingCount === 0 && !!slide;
+    };
+    
+    const start = () => {
+        new MutationObserver(update).observe(document.documentElement, {
+            childList: true, subtree: true, attributes: true, attributeFilter: ['class'], characterData: true
+        });
+        scan(document.documentElement);
+        update([]);
+    };
+    
+    if (document.documentElement) {
+        start();
+    } else {
+        document.addEventListener('DOMContentLoaded', start);
+    }
+}'''
+
+# True once the DOM has changed since mutation count n and then stayed quiet for 100ms
+# with no loading indicators; the slide change signal for decks without a counter
+SLIDE_SETTLED_JS = '''n => window.__mutationCount > n && window.__ready &&
+    performance.now() - window.__lastMutationAt > 100'''
+
+# True once the current slide shows real content: no loading indicators or placeholders,
+# no loading text, and enough text for a slide. Checked before each sequential capture
+SLIDE_CONTENT_READY_JS = '''() => {
+    // Check for loading indicators tracked by the page observer
+    if (window.__loadingCount > 0 || window.__placeholderCount > 0) {
+        return false;
+    }
+    
+    // Check for meaningful content before reading the text itself
+    if (window.__textLength() < 50) {
+        return false;
+    }
+    const bodyText = (document.querySelector('main, [role="main"]') || document.body).textContent.trim();
+    const lowerText = bodyText.toLowerCase();
+    
+    // Check for loading text or minimal content
+    if (lowerText.includes('loading') ||
+        lowerText.includes('please wait') ||
+        lowerText.includes('yzi')) {  // The minimal title we saw
+        return false;
+    }
+    
+    // Slide navigation elements (like "1/9") are a good sign
+    if (/\\d+\\s*\\/\\s*\\d+/.test(bodyText)) {
+        return true;
+    }
+    
+    // Check for presentation content
+    const hasPresentationContent = lowerText.includes('pitch') ||
+        lowerText.includes('presentation') ||
+        lowerText.includes('slide') ||
+        lowerText.includes('deck') ||
+        bodyText.length > 500;  // Substantial content
+    
+    // More lenient validation - just need substantial content. Images and
+    // loading indicators are already covered by the page observer above
+    return hasPresentationContent && bodyText.length > 200;
+}'''
+
+# Upper bound on waiting for SLIDE_CONTENT_READY_JS before a slide is captured anyway
+SLIDE_CONTENT_MAX_MS = 25000
+
+# Current slide number from the player's slide counter, or null without one
+SLIDE_POSITION_JS = '''() => {
+    const counter = document.querySelector('.player-v2-chrome-controls-slide-count');
+    const position = counter && counter.textContent.match(/(\\d+)\\s*(?:\\/|of)\\s*(\\d+)/i);
+    return position ? Number(position[1]) : null;
+}'''
+
+# CDP key fields for an ArrowRight press sent with Input.dispatchKeyEvent
+ARROW_RIGHT_KEY = {'key': 'ArrowRight', 'code': 'ArrowRight', 'windowsVirtualKeyCode': 39, 'nativeVirtualKeyCode': 39}
+
+# Upper bound on waiting for SLIDE_SETTLED_JS after a slide change
+SLIDE_SETTLE_MAX_MS = 1000
+
+# How long each candidate presentation URL gets to render before the next one is tried
+URL_ATTEMPT_TIMEOUT_MS = 8000
+
+# Resolves after two animation frames, once DOM changes have been painted
+NEXT_PAINT_JS = '() => new Promise(resolve => requestAnimationFrame(() => requestAnimationFrame(resolve)))'
+
+# JPEG quality for slide screenshots; visually lossless for slides at a fraction of PNG size
+SCREENSHOT_QUALITY = 85
+# Lower quality for screen previews, where JPEG artefacts are not visible at page size
+PREVIEW_SCREENSHOT_QUALITY = 60
+
+# Landscape letter in points, the size of every PDF page
+PAGE_SIZE = (792, 612)
+
+# Slide capture size. A landscape letter page is 792x612pt, so 1280x720 already oversamples
+# it at 72 DPI; full fidelity captures 1920x1080 at roughly twice the transfer and file size
+CAPTURE_SIZE = (1280, 720)
+FULL_FIDELITY_SIZE = (1920, 1080)
+# Screen previews only need to fill a page at ~72 DPI, roughly a third of the default's pixels
+PREVIEW_SIZE = (960, 540)
+
+# Decks with at least this many slides are captured in parallel tabs
+PARALLEL_MIN_SLIDES = 6
+
+# Upper bound on parallel capture tabs open at once across all downloads; each one is a
+# full page load and renderer process, so more tabs stop paying off once Chromium is
+# CPU-bound, and concurrent downloads must not multiply them past the host's memory
+PARALLEL_MAX_TABS = int(os.getenv('PARALLEL_MAX_TABS', '5'))
+
+def parallel_tab_count(total_slides: int) -> int:
+    """Number of tabs a parallel capture of total_slides would use"""
+    return max(1, min(total_slides, os.cpu_count() or 1, PARALLEL_MAX_TABS))
+
+# Pages kept warm in the shared browser, one per concurrent download
+BROWSER_POOL_SIZE = int(os.getenv('N_CONCURRENT_REQUESTS', '1'))
+
+# Downloads a pooled page serves before it is closed and replaced
+BROWSER_PAGE_MAX_USES = int(os.getenv('BROWSER_PAGE_MAX_USES', '50'))
+
+# Ultra-stealth browser configuration
+# Always use headless mode for Render.com compatibility
+BROWSER_LAUNCH_OPTIONS = {
+    'headless': True,  # Always headless for Render.com
+    'args': [
+        '--no-sandbox',
+        '--disable-setuid-sandbox',
+        '--disable-dev-shm-usage',
+        '--disable-gpu',
+        '--disable-web-security',
+        '--window-size=1280,720',
+        '--disable-extensions',
+        '--disable-plugins',
+        '--no-first-run',
+        '--disable-default-apps',
+        '--disable-blink-features=AutomationControlled',
+        # Chrome honours only the last --disable-features switch, so keep one. It overrides
+        # pyppeteer's default of site-per-process, which is therefore listed again here;
+        # the rest are background services that compete with rendering
+        '--disable-features=VizDisplayCompositor,TranslateUI,Translate,BlinkGenPropertyTrees,'
+        'IsolateOrigins,site-per-process,BackForwardCache,AcceptCHFrame,MediaRouter,'
+        'OptimizationHints,InterestCohort,CalculateNativeWinOcclusion',
+        '--disable-ipc-flooding-protection',
+        '--disable-renderer-backgrounding',
+        '--disable-backgrounding-occluded-windows',
+        '--disable-client-side-phishing-detection',
+        '--disable-sync',
+        '--disable-translate',
+        '--hide-scrollbars',
+        '--mute-audio',
+        '--no-default-browser-check',
+        '--no-pings',
+        '--password-store=basic',
+        '--use-mock-keychain',
+        '--disable-component-extensions-with-background-pages',
+        '--disable-background-timer-throttling',
+        '--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        '--exclude-switches=enable-automation',
+        '--disable-extensions-except',
+        '--disable-plugins-discovery',
+        '--disable-background-networking',
+        '--disable-hang-monitor',
+        '--disable-prompt-on-repost',
+        '--metrics-recording-only',
+        '--safebrowsing-disable-auto-update',
+        '--disable-notifications',
+        '--disable-popup-blocking',
+        '--disable-domain-reliability',
+        '--disable-component-update',
+        '--disable-site-isolation-trials'
+    ],
+    # Applied to every new page, so pages need no separate setViewport call.
+    # Pin DPR 1 so hosts with HiDPI defaults do not produce 4x larger screenshots
+    'defaultViewport': {
+        'width': CAPTURE_SIZE[0],
+        'height': CAPTURE_SIZE[1],
+        'deviceScaleFactor': 1,
+        'hasTouch': False,
+        'isLandscape': True,
+        'isMobile': False
+    },
+    'ignoreHTTPSErrors': True,
+    'ignoreDefaultArgs': ['--enable-automation'],
+    'handleSIGINT': False,
+    'handleSIGTERM': False,
+    'handleSIGHUP': False
+}
+
+# Chromium runs the default multi-process model. Hosts that cannot afford separate
+# renderer processes can opt into one process, which serializes rendering across tabs
+if os.getenv('PITCH_SINGLE_PROCESS') == '1':
+    BROWSER_LAUNCH_OPTIONS['args'] += ['--single-process', '--no-zygote']
+
+async def setup_stealth_page(page):
+    """Apply stealth configuration to a freshly opened page"""
+    # Block media and tracker requests in the browser itself; unlike request interception
+    # this needs no round trip to Python per request and keeps the HTTP cache on
+    await page._client.send('Network.setBlockedURLs', {'urls': BLOCKED_URLS})
+    
+    # Track slide changes and readiness from the first document onwards
+    await page.evaluateOnNewDocument(PAGE_OBSERVER_JS)
+    
+    # Set ultra-realistic headers (the user agent comes from the launch args)
+    await page.setExtraHTTPHeaders({
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.9',
+        'Accept-Encoding': 'gzip, deflate, br',
+        'DNT': '1',
+        'Connection': 'keep-alive',
+        'Upgrade-Insecure-Requests': '1',
+        'Sec-Fetch-Dest': 'document',
+        'Sec-Fetch-Mode': 'navigate',
+        'Sec-Fetch-Site': 'none',
+        'Cache-Control': 'max-age=0'
+    })
+    
+    # Remove webdriver property safely
+    await page.evaluate('''() => {
+        try {
+            if (navigator.webdriver !== undefined) {
+                delete navigator.webdriver;
+            }
+            Object.defineProperty(navigator, 'webdriver', {
+                get: () => undefined,
+                configurable: true
+            });
+        } catch (e) {
+            console.log('Webdriver property already handled');
+        }
+    }''')
+    
+    # Override plugins safely
+    await page.evaluate('''() => {
+        try {
+            if (navigator.plugins) {
+                Object.defineProperty(navigator, 'plugins', {
+                    get: () => [1, 2, 3, 4, 5],
+                    configurable: true
+                });
+            }
+        } catch (e) {
+            console.log('Plugins already handled');
+        }
+    }''')
+    
+    # Override languages safely
+    await page.evaluate('''() => {
+        try {
+            if (navigator.languages) {
+                Object.defineProperty(navigator, 'languages', {
+                    get: () => ['en-US', 'en'],
+                    configurable: true
+                });
+            }
+        } catch (e) {
+            console.log('Languages already handled');
+        }
+    }''')
+    
+    # Override permissions safely
+    await page.evaluate('''() => {
+        try {
+            const originalQuery = window.navigator.permissions.query;
+            window.navigator.permissions.query = (parameters) => (
+                parameters.name === 'notifications' ?
+                    Promise.resolve({ state: Notification.permission }) :
+                    originalQuery(parameters)
+            );
+        } catch (e) {
+            console.log('Permissions already handled');
+        }
+    }''')
+
+async def wait_for_page_function(page, page_function: str, timeout_ms: int, *args, polling='raf'):
+    """
+    waitForFunction polled once per animation frame (or every `polling` ms), with a
+    Python-side deadline in case the page stops answering before the in-page timeout fires
+    """
+    await asyncio.wait_for(
+        page.waitForFunction(page_function, {'timeout': timeout_ms, 'polling': polling}, *args),
+        timeout=timeout_ms / 1000 + 1
+    )
+
+browser_pool = BrowserPool(
+    BROWSER_LAUNCH_OPTIONS, setup_stealth_page, size=BROWSER_POOL_SIZE, max_page_uses=BROWSER_PAGE_MAX_USES,
+    max_tabs=PARALLEL_MAX_TABS
+)
+
+# Set by the process-wide signal handlers; every running download stops at its next checkpoint
+shutdown_event = threading.Event()
+_shutdown_handlers_lock = threading.Lock()
+_shutdown_handlers_installed = False
+
+def install_shutdown_handlers():
+    """
+    Make SIGTERM/SIGINT set shutdown_event, once per process. The first signal asks
+    downloads to stop gracefully and restores the previous handlers, so a second one
+    gets the original behaviour. Raises ValueError off the main thread.
+    """
+    global _shutdown_handlers_installed
+    with _shutdown_handlers_lock:
+        if _shutdown_handlers_installed:
+            return
+        
+        signums = (signal.SIGTERM, signal.SIGINT)
+        previous_handlers = {signum: signal.getsignal(signum) for signum in signums}
+        
+        def signal_handler(signum, frame):
+            logger.info(f"Received signal {signum}, marking downloads for shutdown")
+            shutdown_event.set()
+            for previous_signum, handler in previous_handlers.items():
+                signal.signal(previous_signum, handler)
+        
+        for signum in signums:
+            signal.signal(signum, signal_handler)
+        _shutdown_handlers_installed = True
+
 class StealthPitchDownloader:
-    def __init__(self, max_slides: int = 15, timeout: int = 180):
+    def __init__(self, max_slides: int = 15, timeout: int = 180, parallel_capture: bool = True,
+                 image_format: str = 'jpeg', full_fidelity: bool = False, vector_pdf: bool = False,
+                 inline_base64: bool = True, install_signal_handlers: bool = False,
+                 nav_timeout_ms: int = 15000, preview: bool = False):
         self.browser = None
         self.page = None
         self.max_slides = max_slides
         self.timeout = timeout
-        self.loop = None
+        self.parallel_capture = parallel_capture
+        self.image_format = image_format  # 'jpeg', or 'png' when lossless slides matter
+        # Full fidelity trades ~2x larger screenshots and PDFs for sharper zoomed-in slides;
+        # preview goes the other way for PDFs that are only viewed on screen
+        if full_fidelity:
+            self.capture_width, self.capture_height = FULL_FIDELITY_SIZE
+        elif preview:
+            self.capture_width, self.capture_height = PREVIEW_SIZE
+        else:
+            self.capture_width, self.capture_height = CAPTURE_SIZE
+        self.screenshot_quality = PREVIEW_SCREENSHOT_QUALITY if preview else SCREENSHOT_QUALITY
+        # Print slides with Chromium's PDF backend instead of screenshots: selectable text and
+        # no rasterization, but captured sequentially on the main page
+        self.vector_pdf = vector_pdf
+        # Without inline base64 the result only references the saved file (file_id/file_path)
+        self.inline_base64 = inline_base64
+        # Off by default so the web server keeps its own SIGTERM/SIGINT handling;
+        # it can call request_shutdown() instead. See install_shutdown_handlers()
+        self.install_signal_handlers = install_signal_handlers
+        # Navigations only wait for DOMContentLoaded, so a stuck one fails fast and the
+        # readiness gate decides whether the page is usable
+        self.nav_timeout_ms = nav_timeout_ms
         self._shutdown_requested = False
         
     def launch_browser_sync(self):
-        """Launch browser with stealth configuration"""
+        """Acquire a warm stealth page from the shared browser pool"""
         try:
-            logger.info("Launching stealth browser...")
-
-            # Create persistent event loop
-            self.loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(self.loop)
-
-            # Ultra-stealth browser configuration
-            # Always use headless mode for Render.com compatibility
-            self.browser = self.loop.run_until_complete(launch({
-                'headless': True,  # Always headless for Render.com
-                'args': [
-                    '--no-sandbox',
-                    '--disable-setuid-sandbox',
-                    '--disable-dev-shm-usage',
-                    '--disable-gpu',
-                    '--disable-web-security',
-                    '--window-size=1920,1080',
-                    '--disable-extensions',
-                    '--disable-plugins',
-                    '--no-first-run',
-                    '--disable-default-apps',
-                    '--disable-blink-features=AutomationControlled',
-                    '--disable-features=VizDisplayCompositor',
-                    '--disable-ipc-flooding-protection',
-                    '--disable-renderer-backgrounding',
-                    '--disable-backgrounding-occluded-windows',
-                    '--disable-client-side-phishing-detection',
-                    '--disable-sync',
-                    '--disable-translate',
-                    '--hide-scrollbars',
-                    '--mute-audio',
-                    '--no-default-browser-check',
-                    '--no-pings',
-                    '--password-store=basic',
-                    '--use-mock-keychain',
-                    '--disable-component-extensions-with-background-pages',
-                    '--disable-background-timer-throttling',
-                    '--disable-features=TranslateUI',
-                    '--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                    '--exclude-switches=enable-automation',
-                    '--disable-extensions-except',
-                    '--disable-plugins-discovery',
-                    '--disable-background-networking',
-                    '--disable-hang-monitor',
-                    '--disable-prompt-on-repost',
-                    '--metrics-recording-only',
-                    '--safebrowsing-disable-auto-update'
-                ],
-                'defaultViewport': {'width': 1920, 'height': 1080},
-                'ignoreHTTPSErrors': True,
-                'ignoreDefaultArgs': ['--enable-automation'],
-                'handleSIGINT': False,
-                'handleSIGTERM': False,
-                'handleSIGHUP': False
-            }))
-
-            self.page = self.loop.run_until_complete(self.browser.newPage())
-            
-            # Set realistic viewport
-            self.loop.run_until_complete(self.page.setViewport({
-                'width': 1920,
-                'height': 1080,
-                'deviceScaleFactor': 1,
-                'hasTouch': False,
-                'isLandscape': True,
-                'isMobile': False
-            }))
-            
-            # Set ultra-realistic headers and user agent
-            self.loop.run_until_complete(self.page.setExtraHTTPHeaders({
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'DNT': '1',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1',
-                'Sec-Fetch-Dest': 'document',
-                'Sec-Fetch-Mode': 'navigate',
-                'Sec-Fetch-Site': 'none',
-                'Cache-Control': 'max-age=0'
-            }))
-            
-            # Set realistic user agent
-            self.loop.run_until_complete(self.page.setUserAgent(
-                'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            ))
-            
-            # Remove webdriver property safely
-            self.loop.run_until_complete(self.page.evaluate('''() => {
-                try {
-                    if (navigator.webdriver !== undefined) {
-                        delete navigator.webdriver;
-                    }
-                    Object.defineProperty(navigator, 'webdriver', {
-                        get: () => undefined,
-                        configurable: true
-                    });
-                } catch (e) {
-                    console.log('Webdriver property already handled');
-                }
-            }'''))
+            logger.info("Acquiring stealth browser page...")
             
-            # Override plugins safely
-            self.loop.run_until_complete(self.page.evaluate('''() => {
-                try {
-                    if (navigator.plugins) {
-                        Object.defineProperty(navigator, 'plugins', {
-                            get: () => [1, 2, 3, 4, 5],
-                            configurable: true
-                        });
-                    }
-                } catch (e) {
-                    console.log('Plugins already handled');
-                }
-            }'''))
+            self.browser, self.page = self._run(browser_pool.acquire())
+            self.page.setDefaultNavigationTimeout(self.nav_timeout_ms)
+            self._run(self._apply_capture_size(self.page))
             
-            # Override languages safely
-            self.loop.run_until_complete(self.page.evaluate('''() => {
-                try {
-                    if (navigator.languages) {
-                        Object.defineProperty(navigator, 'languages', {
-                            get: () => ['en-US', 'en'],
-                            configurable: true
-                        });
-                    }
-                } catch (e) {
-                    console.log('Languages already handled');
-                }
-            }'''))
-            
-            # Override permissions safely
-            self.loop.run_until_complete(self.page.evaluate('''() => {
-                try {
-                    const originalQuery = window.navigator.permissions.query;
-                    window.navigator.permissions.query = (parameters) => (
-                        parameters.name === 'notifications' ?
-                            Promise.resolve({ state: Notification.permission }) :
-                            originalQuery(parameters)
-                    );
-                } catch (e) {
-                    console.log('Permissions already handled');
-                }
-            }'''))
-
-            logger.info("Stealth browser launched successfully")
+            logger.info("Stealth browser page ready")
             return True
-
+            
         except Exception as e:
             logger.error(f"Browser launch failed: {e}")
             return False
     
+    def _run(self, coro):
+        """Run a coroutine on the browser pool loop, giving up after the download timeout"""
+        return browser_pool.run(coro, self.timeout)
+    
+    async def _apply_capture_size(self, page):
+        """Resize the viewport to the capture size; pooled pages keep the size of their last download"""
+        viewport = page.viewport or {}
+        if (viewport.get('width'), viewport.get('height')) != (self.capture_width, self.capture_height):
+            await page.setViewport({
+                **BROWSER_LAUNCH_OPTIONS['defaultViewport'],
+                'width': self.capture_width,
+                'height': self.capture_height
+            })
+    
     def navigate_to_presentation_sync(self, url: str) -> bool:
         """Navigate with aggressive stealth behavior"""
         try:
             logger.info(f"Navigating to: {url}")
             
             # Set additional stealth properties safely
-            self.loop.run_until_complete(self.page.evaluate('''() => {
+            self._run(self.page.evaluate('''() => {
                 // Override automation detection safely
                 try {
                     if (navigator.webdriver !== undefined) {
@@ -243,68 +567,71 @@ class StealthPitchDownloader:
                 }
             }'''))
             
-            # Try multiple navigation approaches
+            # Try multiple navigation approaches, stopping at the first one that renders
             logger.info("Attempting direct presentation access...")
             
-            # Method 1: Try the original URL
-            try:
-                self.loop.run_until_complete(self.page.goto(url, {'waitUntil': 'networkidle2', 'timeout': 60000}))
-                logger.info("Original URL navigation successful")
-            except Exception as e:
-                logger.warning(f"Original URL failed: {e}")
-            
-            # Method 2: Try presentation mode URL
-            try:
-                if '/v/' in url:
-                    # Extract the presentation ID and try presentation mode
-                    parts = url.split('/v/')
-                    if len(parts) > 1:
-                        pres_id = parts[1].split('/')[0]
-                        pres_url = f"https://pitch.com/present/{pres_id}"
-                        logger.info(f"Trying presentation mode URL: {pres_url}")
-                        self.loop.run_until_complete(self.page.goto(pres_url, {'waitUntil': 'networkidle2', 'timeout': 60000}))
-                        logger.info("Presentation mode URL navigation successful")
-            except Exception as e:
-                logger.warning(f"Presentation mode URL failed: {e}")
+            # Method 1: the original URL; Methods 2 and 3: presentation and embed mode
+            urls_to_try = [('Original', url)]
+            if '/v/' in url:
+                # Extract the presentation ID and try presentation mode
+                pres_id = url.split('/v/')[1].split('/')[0]
+                urls_to_try.append(('Presentation mode', f"https://pitch.com/present/{pres_id}"))
+                urls_to_try.append(('Embed mode', url + '?embed=true'))
             
-            # Method 3: Try embed mode
-            try:
-                if '/v/' in url:
-                    embed_url = url + '?embed=true'
-                    logger.info(f"Trying embed mode URL: {embed_url}")
-                    self.loop.run_until_complete(self.page.goto(embed_url, {'waitUntil': 'networkidle2', 'timeout': 60000}))
-                    logger.info("Embed mode URL navigation successful")
-            except Exception as e:
-                logger.warning(f"Embed mode URL failed: {e}")
-            
-            # Wait much longer for content to load
-            delay = random.uniform(15, 25)
-            logger.info(f"Waiting {delay:.1f}s for page load...")
-            self.loop.run_until_complete(asyncio.sleep(delay))
-            
-            # Try to trigger presentation loading with multiple methods
-            logger.info("Attempting multiple presentation triggers...")
-            
-            # Method 1: Click multiple times in different locations
-            for i in range(5):
-                x = random.randint(200, 800)
-                y = random.randint(200, 600)
-                self.loop.run_until_complete(self.page.mouse.click(x, y))
-                self.loop.run_until_complete(asyncio.sleep(random.uniform(1, 3)))
-            
-            # Method 2: Try keyboard shortcuts
-            keyboard_shortcuts = ['Space', 'Enter', 'F11', 'Escape']
-            for key in keyboard_shortcuts:
+            content_ready = False
+            for label, attempt_url in urls_to_try:
                 try:
-                    self.loop.run_until_complete(self.page.keyboard.press(key))
-                    self.loop.run_until_complete(asyncio.sleep(2))
+                    logger.info(f"Trying {label.lower()} URL: {attempt_url}")
+                    self._run(self.page.goto(attempt_url, {'waitUntil': 'domcontentloaded'}))
+                    logger.info(f"{label} URL navigation successful")
+                except PyppeteerTimeoutError as e:
+                    # A slow page may still be usable once its document has been parsed;
+                    # the readiness gate below decides
+                    try:
+                        ready_state = self._run(self.page.evaluate('() => document.readyState'))
+                    except PyppeteerError:
+                        ready_state = 'loading'
+                    if ready_state == 'loading':
+                        logger.warning(f"{label} URL timed out before the document was parsed: {e}")
+                        continue
+                    logger.warning(f"{label} URL navigation timed out with readyState '{ready_state}', checking content")
                 except Exception as e:
-                    logger.warning(f"Keyboard shortcut {key} failed: {e}")
+                    logger.warning(f"{label} URL failed: {e}")
+                    continue
+                
+                # A working URL renders within seconds; a dead one should not cost the full wait
+                content_ready = self._wait_for_presentation_ready_sync(URL_ATTEMPT_TIMEOUT_MS, min_text_length=100)
+                if content_ready:
+                    break
             
-            # Method 3: Try scrolling to trigger lazy loading
-            for i in range(3):
-                self.loop.run_until_complete(self.page.evaluate(f'window.scrollTo(0, {random.randint(0, 1000)})'))
-                self.loop.run_until_complete(asyncio.sleep(2))
+            # Try to trigger presentation loading with multiple methods, only if no URL rendered
+            if not content_ready:
+                # Wait for content to load
+                logger.info("Waiting for page load...")
+                self._settle_sync(25000)
+                
+                logger.info("Attempting multiple presentation triggers...")
+                
+                # Method 1: Click multiple times in different locations
+                for i in range(5):
+                    x = random.randint(200, 800)
+                    y = random.randint(200, 600)
+                    self._run(self.page.mouse.click(x, y))
+                    self._run(asyncio.sleep(random.uniform(1, 3)))
+                
+                # Method 2: Try keyboard shortcuts
+                keyboard_shortcuts = ['Space', 'Enter', 'F11', 'Escape']
+                for key in keyboard_shortcuts:
+                    try:
+                        self._run(self.page.keyboard.press(key))
+                        self._settle_sync(2000)
+                    except Exception as e:
+                        logger.warning(f"Keyboard shortcut {key} failed: {e}")
+                
+                # Method 3: Try scrolling to trigger lazy loading
+                for i in range(3):
+                    self._run(self.page.evaluate(f'window.scrollTo(0, {random.randint(0, 1000)})'))
+                    self._settle_sync(2000)
             
             # Try to access the presentation API directly
             logger.info("Attempting direct API access...")
@@ -322,7 +649,7 @@ class StealthPitchDownloader:
                         logger.info(f"Trying API URL: {api_url}")
                         
                         # Make a request to the API
-                        response = self.loop.run_until_complete(self.page.evaluate(f'''() => {{
+                        response = self._run(self.page.evaluate(f'''() => {{
                             return fetch('{api_url}', {{
                                 method: 'GET',
                                 headers: {{
@@ -340,56 +667,57 @@ class StealthPitchDownloader:
                     except Exception as e:
                         logger.warning(f"API access failed: {e}")
             
-            # Try a different approach - wait for network requests to complete
-            logger.info("Waiting for network requests to complete...")
-            self.loop.run_until_complete(asyncio.sleep(30))
+            # Wait until the presentation renders with real text content, in one predicate
+            if not content_ready:
+                logger.info("Waiting for presentation content to render...")
+                content_ready = self._wait_for_presentation_ready_sync(30000, min_text_length=100)
             
-            # Check if any content loaded
-            content_check = self.loop.run_until_complete(self.page.evaluate('''() => {
-                const bodyText = document.body.innerText.trim();
-                const loadingElements = document.querySelectorAll('[class*="loading"], [class*="spinner"]');
+            if not content_ready:
+                # Check if any content loaded
+                content_check = self._run(self.page.evaluate('''() => {
+                    const bodyText = (document.querySelector('main, [role="main"]') || document.body).textContent.trim();
+                    
+                    return {
+                        textLength: bodyText.length,
+                        loadingElements: window.__loadingCount || 0,
+                        hasSlideNumbers: bodyText.match(/\\d+\\s*\\/\\s*\\d+/),
+                        bodyHTML: document.body.innerHTML.length
+                    };
+                }'''))
                 
-                return {
-                    textLength: bodyText.length,
-                    loadingElements: loadingElements.length,
-                    hasSlideNumbers: bodyText.match(/\\d+\\s*\\/\\s*\\d+/),
-                    bodyHTML: document.body.innerHTML.length
-                };
-            }'''))
-            
-            logger.info(f"Extended wait content check: {content_check}")
-            
-            # If still no content, try refreshing and waiting even longer
-            if content_check['textLength'] < 100:
-                logger.warning("Still no content after extended wait, trying refresh...")
-                self.loop.run_until_complete(self.page.reload({'waitUntil': 'networkidle2', 'timeout': 60000}))
-                self.loop.run_until_complete(asyncio.sleep(20))
+                logger.info(f"Extended wait content check: {content_check}")
                 
-                # Try clicking to start presentation
-                self.loop.run_until_complete(self.page.click('body'))
-                self.loop.run_until_complete(asyncio.sleep(10))
+                # If still no content, try refreshing and waiting even longer
+                if content_check['textLength'] < 100:
+                    logger.warning("Still no content after extended wait, trying refresh...")
+                    self._run(self.page.reload({'waitUntil': 'domcontentloaded'}))
+                    self._settle_sync(20000)
+                    
+                    # Try clicking to start presentation
+                    self._run(self.page.click('body'))
+                    self._settle_sync(10000)
             
             # More aggressive human simulation
             logger.info("Simulating extensive human behavior...")
             
             # Simulate reading behavior
             for i in range(3):
-                self.loop.run_until_complete(self.page.evaluate(f'''() => {{
+                self._run(self.page.evaluate(f'''() => {{
                     // Random scroll patterns
                     window.scrollTo(0, {random.randint(0, 500)});
                 }}'''))
-                self.loop.run_until_complete(asyncio.sleep(random.uniform(1, 3)))
+                self._run(asyncio.sleep(random.uniform(1, 3)))
                 
                 # Move mouse around
-                self.loop.run_until_complete(self.page.mouse.move(
+                self._run(self.page.mouse.move(
                     random.randint(100, 800), 
                     random.randint(100, 600)
                 ))
-                self.loop.run_until_complete(asyncio.sleep(random.uniform(0.5, 2)))
+                self._run(asyncio.sleep(random.uniform(0.5, 2)))
             
             # Try to trigger presentation loading
             logger.info("Attempting to trigger presentation loading...")
-            self.loop.run_until_complete(self.page.evaluate('''() => {
+            self._run(self.page.evaluate('''() => {
                 // Try clicking on the page to trigger loading
                 const clickEvent = new MouseEvent('click', {
                     view: window,
@@ -412,19 +740,15 @@ class StealthPitchDownloader:
             }'''))
             
             # Wait for potential loading
-            self.loop.run_until_complete(asyncio.sleep(random.uniform(3, 6)))
+            self._settle_sync(6000)
             
             # Check page content more thoroughly with iframe handling
             try:
-                page_title = self.loop.run_until_complete(self.page.title())
+                page_title = self._run(self.page.title())
                 logger.info(f"Page title: {page_title}")
                 
-                # Wait for iframes to load
-                logger.info("Waiting for iframes to load...")
-                self.loop.run_until_complete(asyncio.sleep(5))
-                
                 # Check for and handle iframes
-                iframe_info = self.loop.run_until_complete(self.page.evaluate('''() => {
+                iframe_info = self._run(self.page.evaluate('''() => {
                     const iframes = document.querySelectorAll('iframe');
                     console.log('Found iframes:', iframes.length);
                     
@@ -447,15 +771,15 @@ class StealthPitchDownloader:
                     logger.info("Found iframes, attempting to access presentation content...")
                     
                     # Try to get content from iframes
-                    iframe_content = self.loop.run_until_complete(self.page.evaluate('''() => {
+                    iframe_content = self._run(self.page.evaluate('''() => {
                         const iframes = document.querySelectorAll('iframe');
-                        let totalContent = '';
+                        let totalLength = 0;
                         
                         for (let iframe of iframes) {
                             try {
                                 if (iframe.contentDocument) {
-                                    const iframeText = iframe.contentDocument.body.innerText || '';
-                                    totalContent += iframeText;
+                                    const iframeText = iframe.contentDocument.body.textContent || '';
+                                    totalLength += iframeText.length;
                                     console.log('Iframe content length:', iframeText.length);
                                 }
                             } catch (e) {
@@ -463,14 +787,15 @@ class StealthPitchDownloader:
                             }
                         }
                         
-                        return totalContent;
+                        // Only the length is logged, so keep the text in the page
+                        return totalLength;
                     }'''))
                     
-                    logger.info(f"Iframe content length: {len(iframe_content) if iframe_content else 0}")
+                    logger.info(f"Iframe content length: {iframe_content or 0}")
                 
                 # More comprehensive content check
-                content_info = self.loop.run_until_complete(self.page.evaluate('''() => {
-                    const bodyText = document.body.innerText.trim();
+                content_info = self._run(self.page.evaluate('''() => {
+                    const bodyText = (document.querySelector('main, [role="main"]') || document.body).textContent.trim();
                     const bodyHTML = document.body.innerHTML;
                     
                     // Look for specific Pitch.com elements
@@ -478,11 +803,6 @@ class StealthPitchDownloader:
                         '[class*="pitch"], [class*="presentation"], [class*="slide"], [class*="deck"]'
                     );
                     
-                    // Check for loading states
-                    const loadingElements = document.querySelectorAll(
-                        '[class*="loading"], [class*="spinner"], [class*="skeleton"]'
-                    );
-                    
                     // Check for iframes
                     const iframes = document.querySelectorAll('iframe');
                     
@@ -496,7 +816,7 @@ class StealthPitchDownloader:
                         textLength: bodyText.length,
                         htmlLength: bodyHTML.length,
                         pitchElements: pitchElements.length,
-                        loadingElements: loadingElements.length,
+                        loadingElements: window.__loadingCount || 0,
                         iframes: iframes.length,
                         slideNav: slideNav.length,
                         arrows: arrows.length,
@@ -512,28 +832,28 @@ class StealthPitchDownloader:
                 # Wait longer for content to load if we have loading elements
                 if content_info['loadingElements'] > 0:
                     logger.info(f"Found {content_info['loadingElements']} loading elements, waiting longer...")
-                    self.loop.run_until_complete(asyncio.sleep(10))
+                    self._wait_for_presentation_ready_sync(10000)
                     
                     # Try clicking to trigger loading
-                    self.loop.run_until_complete(self.page.click('body'))
-                    self.loop.run_until_complete(asyncio.sleep(5))
+                    self._run(self.page.click('body'))
+                    self._settle_sync(5000)
                 
                 # If we still don't have good content, try different approaches
                 if content_info['textLength'] < 100:
                     logger.warning("Still minimal content, trying alternative approaches...")
                     
                     # Try pressing Enter to start presentation
-                    self.loop.run_until_complete(self.page.keyboard.press('Enter'))
-                    self.loop.run_until_complete(asyncio.sleep(3))
+                    self._run(self.page.keyboard.press('Enter'))
+                    self._settle_sync(3000)
                     
                     # Try pressing Space
-                    self.loop.run_until_complete(self.page.keyboard.press('Space'))
-                    self.loop.run_until_complete(asyncio.sleep(3))
+                    self._run(self.page.keyboard.press('Space'))
+                    self._settle_sync(3000)
                     
                     # Try clicking multiple times
                     for i in range(3):
-                        self.loop.run_until_complete(self.page.click('body'))
-                        self.loop.run_until_complete(asyncio.sleep(2))
+                        self._run(self.page.click('body'))
+                        self._settle_sync(2000)
                     
             except Exception as e:
                 logger.warning(f"Content analysis failed: {e}")
@@ -545,16 +865,145 @@ class StealthPitchDownloader:
             logger.error(f"Navigation failed: {e}")
             return False
     
+    def _wait_for_presentation_ready_sync(self, timeout_ms: int, min_text_length: int = 0) -> bool:
+        """Wait for the main page's presentation content to be ready"""
+        return self._run(self._wait_for_presentation_ready(self.page, timeout_ms, min_text_length))
+    
+    async def _wait_for_presentation_ready(self, page, timeout_ms: int, min_text_length: int = 0) -> bool:
+        """
+        Wait for the document to finish loading and the page observer to report slide
+        content with no loading indicators, and optionally for at least min_text_length
+        characters of page text. Navigation only waits for DOMContentLoaded, so this is
+        the single readiness gate.
+        """
+        try:
+            # The observer caches the text length between mutations, keeping raf polls cheap
+            await wait_for_page_function(page, '''minText => document.readyState === 'complete' && window.__ready &&
+                (!minText || window.__textLength() >= minText)''',
+                timeout_ms, min_text_length)
+            logger.info("Presentation content ready")
+            return True
+            
+        except (asyncio.TimeoutError, PyppeteerError) as e:
+            logger.warning(f"Presentation not ready after {timeout_ms}ms: {e}")
+            return False
+    
+    def _settle_sync(self, timeout_ms: int) -> bool:
+        """Wait for the main page to be ready and painted"""
+        return self._run(self._settle(self.page, timeout_ms))
+    
+    async def _settle(self, page, timeout_ms: int) -> bool:
+        """Wait up to timeout_ms for the page observer, then two animation frames so the result is painted"""
+        ready = await self._wait_for_presentation_ready(page, timeout_ms)
+        try:
+            await page.evaluate(NEXT_PAINT_JS)
+        except PyppeteerError as e:
+            # A navigation inside the settle window destroys the context; the new page paints on its own
+            logger.warning(f"Paint wait interrupted: {e}")
+            return False
+        return ready
+    
     def detect_slide_count_sync(self) -> int:
         """Detect slide count with comprehensive detection methods"""
         try:
             logger.info("Detecting slide count with comprehensive methods...")
             
             # Wait for page to fully load
-            self.loop.run_until_complete(asyncio.sleep(random.uniform(3, 6)))
+            self._settle_sync(6000)
+            
+            # One probe answers every non-destructive method; stepping through
+            # the deck (Method 2) only runs when none of them finds a count
+            probe = self._run(self._bulk_probe())
             
             # Method 1: Look for slide counter with enhanced detection
-            slide_count = self.loop.run_until_complete(self.page.evaluate('''() => {
+            slide_count = probe['counter']
+            if slide_count:
+                logger.info(f"Found slide counter text: '{slide_count}'")
+                total = parse_slide_total(slide_count)
+                if total:
+                    logger.info(f"Parsed slide count: {total} slides")
+                    return min(total, self.max_slides)
+
+            # Before stepping through the deck, ask the player for its length directly
+            deck_length = probe['deckLength']
+            if deck_length:
+                logger.info(f"Found {deck_length} slides from deck globals")
+                return min(deck_length, self.max_slides)
+            
+            # Method 3: Look for slide indicators/dots
+            dots_count = probe['dots']
+            if dots_count > 0:
+                logger.info(f"Found {dots_count} slide indicators")
+                return min(dots_count, self.max_slides)
+            
+            # Method 4: Look for slide content areas
+            content_slides = probe['contentSlides']
+            if content_slides > 0:
+                logger.info(f"Found {content_slides} content slide elements")
+                return min(content_slides, self.max_slides)
+            
+            # Method 5: Try to detect by looking at the URL or page structure
+            url_slides = probe['dataSlides']
+            if url_slides > 0:
+                logger.info(f"Found {url_slides} slides from data attributes")
+                return min(url_slides, self.max_slides)
+
+            # Method 2: Navigate through slides to count them
+            if probe['hasNavigation']:
+                logger.info("Found navigation elements, will count by navigating")
+                return self._count_slides_by_navigation()
+            
+            # Method 6: Try to force presentation mode
+            logger.info("Trying to force presentation mode...")
+            try:
+                # Try pressing F11 for fullscreen
+                self._run(self.page.keyboard.press('F11'))
+                self._settle_sync(2000)
+                
+                # Try pressing space to start presentation
+                self._run(self.page.keyboard.press('Space'))
+                self._settle_sync(3000)
+                
+                # Try clicking on the center of the page
+                self._run(self.page.click('body'))
+                self._settle_sync(2000)
+                
+                # Check if we now have better content
+                new_content = self._run(self.page.evaluate('() => window.__textLength()'))
+                
+                logger.info(f"Content length after presentation mode attempt: {new_content}")
+                
+            except Exception as e:
+                logger.warning(f"Presentation mode attempt failed: {e}")
+            
+            # Method 7: Try different URL patterns
+            logger.info("Trying alternative URL patterns...")
+            try:
+                current_url = self.page.url
+                logger.info(f"Current URL: {current_url}")
+                
+                # Try adding presentation parameters
+                if 'presentation' not in current_url.lower():
+                    alt_url = current_url + '?presentation=true'
+                    logger.info(f"Trying alternative URL: {alt_url}")
+                    self._run(self.page.goto(alt_url, {'waitUntil': 'domcontentloaded'}))
+                    self._settle_sync(15000)
+                
+            except Exception as e:
+                logger.warning(f"Alternative URL attempt failed: {e}")
+            
+            # Default fallback - try a higher number
+            logger.info("Using fallback: 15 slides (increased from 12)")
+            return min(15, self.max_slides)
+            
+        except Exception as e:
+            logger.error(f"Slide detection failed: {e}")
+            return min(12, self.max_slides)
+    
+    async def _bulk_probe(self) -> Dict:
+        """Run every non-destructive slide count probe in one evaluate round trip"""
+        return await self.page.evaluate('''() => {
+            const findCounter = () => {
                 // Try multiple selectors for slide counter
                 const selectors = [
                     '.player-v2-chrome-controls-slide-count',
@@ -575,40 +1024,42 @@ class StealthPitchDownloader:
                     '.nav-counter',
                     '.slide-nav'
                 ];
-                
+            
                 for (const selector of selectors) {
                     const element = document.querySelector(selector);
                     if (element && element.textContent) {
-                        const text = element.textContent.trim();
+                        // Broad selectors can hit whole toolbars; a counter is a few characters
+                        const text = element.textContent.trim().slice(0, 200);
                         console.log('Found counter element:', selector, text);
                         return text;
                     }
                 }
-                
-                // Check all elements with text containing numbers (more thorough)
-                const allElements = document.querySelectorAll('*');
-                for (const element of allElements) {
-                    const text = element.textContent || '';
-                    if (text.includes('/') && text.match(/\\d+\\s*\\/\\s*\\d+/)) {
-                        console.log('Found counter in text:', text);
-                        return text;
-                    }
-                }
-                
-                // Try to find any text that looks like slide numbers in body
-                const bodyText = document.body.innerText;
-                const slideMatch = bodyText.match(/(\\d+)\\s*\\/\\s*(\\d+)/);
+            
+                // Match slide numbers in the page text and return only the match, never the
+                // text itself. The first element whose text matched in a per-element walk was
+                // always <html>, so that walk shipped the whole document over CDP. Only
+                // rendered body text counts: CSS such as aspect-ratio:16/9 in <style> or
+                // <script> text would otherwise read as slide 16 of 9
+                const SKIPPED_TAGS = new Set(['SCRIPT', 'STYLE', 'NOSCRIPT', 'TEMPLATE']);
+                const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT, {
+                    acceptNode: node => SKIPPED_TAGS.has(node.parentNode.nodeName) ?
+                        NodeFilter.FILTER_REJECT : NodeFilter.FILTER_ACCEPT
+                });
+                const textParts = [];
+                while (walker.nextNode()) textParts.push(walker.currentNode.nodeValue);
+                const pageText = textParts.join('');
+                const slideMatch = pageText.match(/(\\d+)\\s*(?:\\/|of)\\s*(\\d+)/i);
                 if (slideMatch) {
-                    console.log('Found slide pattern in body text:', slideMatch[0]);
+                    console.log('Found slide pattern in page text:', slideMatch[0]);
                     return slideMatch[0];
                 }
-                
+            
                 // Check iframes for slide counters
                 const iframes = document.querySelectorAll('iframe');
                 for (let iframe of iframes) {
                     try {
                         if (iframe.contentDocument) {
-                            const iframeText = iframe.contentDocument.body.innerText || '';
+                            const iframeText = iframe.contentDocument.body.textContent || '';
                             const iframeMatch = iframeText.match(/(\\d+)\\s*\\/\\s*(\\d+)/);
                             if (iframeMatch) {
                                 console.log('Found slide pattern in iframe:', iframeMatch[0]);
@@ -619,25 +1070,29 @@ class StealthPitchDownloader:
                         console.log('Cannot access iframe:', e.message);
                     }
                 }
-                
+            
                 return null;
-            }'''))
+            };
             
-            if slide_count:
-                logger.info(f"Found slide counter text: '{slide_count}'")
-                if '/' in slide_count:
-                    parts = slide_count.split('/')
-                    if len(parts) == 2:
-                        try:
-                            total = int(parts[1].strip())
-                            logger.info(f"Parsed slide count: {total} slides")
-                            return min(total, self.max_slides)
-                        except ValueError:
-                            pass
+            const findDeckLength = () => {
+                try {
+                    if (window.Reveal && Reveal.getTotalSlides) {
+                        return Reveal.getTotalSlides();
+                    }
+                    const state = window.__PITCH_STATE__;
+                    if (state && state.slides && state.slides.length) {
+                        return state.slides.length;
+                    }
+                    if (window.pitch && pitch.deck && pitch.deck.slides) {
+                        return pitch.deck.slides.length;
+                    }
+                } catch (e) {
+                    console.log('Deck globals not readable:', e.message);
+                }
+                return document.querySelectorAll('.slide, [data-slide-idx]').length || null;
+            };
             
-            # Method 2: Navigate through slides to count them
-            logger.info("Trying navigation method to count slides...")
-            slide_count = self.loop.run_until_complete(self.page.evaluate('''() => {
+            const hasNavigation = () => {
                 // Try to find navigation elements
                 const navSelectors = [
                     '[data-testid*="next"]',
@@ -647,7 +1102,7 @@ class StealthPitchDownloader:
                     'button[title*="next"]',
                     'button[aria-label*="next"]'
                 ];
-                
+            
                 for (const selector of navSelectors) {
                     const element = document.querySelector(selector);
                     if (element) {
@@ -656,14 +1111,9 @@ class StealthPitchDownloader:
                     }
                 }
                 return false;
-            }'''))
+            };
             
-            if slide_count:
-                logger.info("Found navigation elements, will count by navigating")
-                return self._count_slides_by_navigation()
-            
-            # Method 3: Look for slide indicators/dots
-            dots_count = self.loop.run_until_complete(self.page.evaluate('''() => {
+            const countDots = () => {
                 const dotSelectors = [
                     '.slide-indicator',
                     '.slide-dot',
@@ -680,14 +1130,9 @@ class StealthPitchDownloader:
                     }
                 }
                 return 0;
-            }'''))
+            };
             
-            if dots_count > 0:
-                logger.info(f"Found {dots_count} slide indicators")
-                return min(dots_count, self.max_slides)
-            
-            # Method 4: Look for slide content areas
-            content_slides = self.loop.run_until_complete(self.page.evaluate('''() => {
+            const countContentSlides = () => {
                 const contentSelectors = [
                     '[class*="slide-content"]',
                     '[class*="presentation-slide"]',
@@ -705,14 +1150,9 @@ class StealthPitchDownloader:
                 }
                 
                 return maxSlides;
-            }'''))
-            
-            if content_slides > 0:
-                logger.info(f"Found {content_slides} content slide elements")
-                return min(content_slides, self.max_slides)
+            };
             
-            # Method 5: Try to detect by looking at the URL or page structure
-            url_slides = self.loop.run_until_complete(self.page.evaluate('''() => {
+            const countDataSlides = () => {
                 // Check if there are any slide-related data attributes
                 const slideElements = document.querySelectorAll('[data-slide-number], [data-slide-index]');
                 if (slideElements.length > 0) {
@@ -722,61 +1162,17 @@ class StealthPitchDownloader:
                     return Math.max(...numbers) + 1;
                 }
                 return 0;
-            }'''))
-            
-            if url_slides > 0:
-                logger.info(f"Found {url_slides} slides from data attributes")
-                return min(url_slides, self.max_slides)
+            };
             
-            # Method 6: Try to force presentation mode
-            logger.info("Trying to force presentation mode...")
-            try:
-                # Try pressing F11 for fullscreen
-                self.loop.run_until_complete(self.page.keyboard.press('F11'))
-                self.loop.run_until_complete(asyncio.sleep(2))
-                
-                # Try pressing space to start presentation
-                self.loop.run_until_complete(self.page.keyboard.press('Space'))
-                self.loop.run_until_complete(asyncio.sleep(3))
-                
-                # Try clicking on the center of the page
-                self.loop.run_until_complete(self.page.click('body'))
-                self.loop.run_until_complete(asyncio.sleep(2))
-                
-                # Check if we now have better content
-                new_content = self.loop.run_until_complete(self.page.evaluate('''() => {
-                    const bodyText = document.body.innerText.trim();
-                    return bodyText.length;
-                }'''))
-                
-                logger.info(f"Content length after presentation mode attempt: {new_content}")
-                
-            except Exception as e:
-                logger.warning(f"Presentation mode attempt failed: {e}")
-            
-            # Method 7: Try different URL patterns
-            logger.info("Trying alternative URL patterns...")
-            try:
-                current_url = self.loop.run_until_complete(self.page.url)
-                logger.info(f"Current URL: {current_url}")
-                
-                # Try adding presentation parameters
-                if 'presentation' not in current_url.lower():
-                    alt_url = current_url + '?presentation=true'
-                    logger.info(f"Trying alternative URL: {alt_url}")
-                    self.loop.run_until_complete(self.page.goto(alt_url, {'waitUntil': 'networkidle2', 'timeout': 30000}))
-                    self.loop.run_until_complete(asyncio.sleep(5))
-                
-            except Exception as e:
-                logger.warning(f"Alternative URL attempt failed: {e}")
-            
-            # Default fallback - try a higher number
-            logger.info("Using fallback: 15 slides (increased from 12)")
-            return min(15, self.max_slides)
-            
-        except Exception as e:
-            logger.error(f"Slide detection failed: {e}")
-            return min(12, self.max_slides)
+            return {
+                counter: findCounter(),
+                deckLength: findDeckLength(),
+                dots: countDots(),
+                contentSlides: countContentSlides(),
+                dataSlides: countDataSlides(),
+                hasNavigation: hasNavigation()
+            };
+        }''')
     
     def _count_slides_by_navigation(self) -> int:
         """Count slides by navigating through them"""
@@ -784,15 +1180,15 @@ class StealthPitchDownloader:
             logger.info("Counting slides by navigation...")
             
             # Go to first slide
-            self.loop.run_until_complete(self.page.keyboard.press('Home'))
-            self.loop.run_until_complete(asyncio.sleep(2))
+            self._run(self.page.keyboard.press('Home'))
+            self._settle_sync(2000)
             
             slide_count = 0
             max_attempts = 20  # Prevent infinite loops
             
             for i in range(max_attempts):
                 # Check if we can navigate to next slide
-                can_navigate = self.loop.run_until_complete(self.page.evaluate('''() => {
+                can_navigate = self._run(self.page.evaluate('''() => {
                     // Check if next button is enabled or if we can press arrow right
                     const nextButton = document.querySelector('[data-testid*="next"], [aria-label*="next"], .next-slide');
                     if (nextButton && !nextButton.disabled) {
@@ -800,7 +1196,7 @@ class StealthPitchDownloader:
                     }
                     
                     // Check if we're at the end
-                    const bodyText = document.body.innerText.toLowerCase();
+                    const bodyText = (document.querySelector('main, [role="main"]') || document.body).textContent.toLowerCase();
                     if (bodyText.includes('end') || bodyText.includes('last slide')) {
                         return false;
                     }
@@ -814,17 +1210,28 @@ class StealthPitchDownloader:
                 
                 slide_count += 1
                 
-                # Navigate to next slide
-                self.loop.run_until_complete(self.page.keyboard.press('ArrowRight'))
-                self.loop.run_until_complete(asyncio.sleep(1))
+                # Navigate to next slide and wait for the counter to move
+                prev_idx = self._run(self.page.evaluate('() => window.__slideIdx || 0'))
+                self._run(self._press_arrow_right(self.page))
+                self._run(self._wait_for_slide_change(self.page, prev_idx, 1000))
                 
-                # Check if we've reached the end
-                is_at_end = self.loop.run_until_complete(self.page.evaluate('''() => {
-                    const bodyText = document.body.innerText.toLowerCase();
-                    return bodyText.includes('end') || bodyText.includes('last slide') || bodyText.includes('finish');
+                # Check if we've reached the end, and read the counter in the same round trip:
+                # players often only show it once the deck has been interacted with
+                state = self._run(self.page.evaluate('''() => {
+                    const bodyText = (document.querySelector('main, [role="main"]') || document.body).textContent.toLowerCase();
+                    const counter = document.querySelector('.player-v2-chrome-controls-slide-count');
+                    return {
+                        atEnd: bodyText.includes('end') || bodyText.includes('last slide') || bodyText.includes('finish'),
+                        counter: counter ? counter.textContent.trim().slice(0, 200) : null
+                    };
                 }'''))
                 
-                if is_at_end:
+                total = parse_slide_total(state['counter'] or '')
+                if total:
+                    logger.info(f"Slide counter appeared during navigation: {total} slides")
+                    return min(total, self.max_slides)
+                
+                if state['atEnd']:
                     break
             
             logger.info(f"Navigation method found {slide_count} slides")
@@ -834,172 +1241,94 @@ class StealthPitchDownloader:
             logger.error(f"Navigation counting failed: {e}")
             return min(12, self.max_slides)
     
+    async def _press_arrow_right(self, page):
+        """
+        Press ArrowRight straight through CDP. The key up is sent without waiting for the
+        key down to be acknowledged; the session handles them in order, so a press costs
+        one round trip instead of keyboard.press's two
+        """
+        await asyncio.gather(
+            page._client.send('Input.dispatchKeyEvent', {'type': 'rawKeyDown', **ARROW_RIGHT_KEY}),
+            page._client.send('Input.dispatchKeyEvent', {'type': 'keyUp', **ARROW_RIGHT_KEY})
+        )
+    
+    async def _press_arrow_right_burst(self, page, n: int):
+        """Send n ArrowRight presses 100ms apart straight through CDP, without waiting on the page"""
+        for _ in range(n):
+            await self._press_arrow_right(page)
+            await asyncio.sleep(0.1)
+    
     def capture_slide_sync(self, slide_number: int) -> Optional[bytes]:
+        """Capture the current slide on the main page"""
+        return self._run(self._capture_slide(slide_number))
+    
+    async def _capture_slide(self, slide_number: int) -> Optional[bytes]:
         """Capture slide with content validation"""
         try:
-            logger.info(f"Capturing slide {slide_number}")
-            
-            # Wait for slide to load with validation
-            max_attempts = 5
-            for attempt in range(max_attempts):
-                # Human-like delay
-                delay = random.uniform(2, 5)
-                self.loop.run_until_complete(asyncio.sleep(delay))
-                
-                # Validate content before capture with Pitch.com specific checks
-                is_valid_content = self.loop.run_until_complete(self.page.evaluate('''() => {
-                    // Check for loading indicators
-                    const loadingElements = document.querySelectorAll(
-                        '[class*="loading"], [class*="spinner"], [class*="loader"], [class*="skeleton"], [class*="placeholder"]'
-                    );
-                    if (loadingElements.length > 0) {
-                        console.log('Still loading, found loading elements:', loadingElements.length);
-                        return false;
-                    }
-                    
-                    // Check for meaningful content
-                    const bodyText = document.body.innerText.trim();
-                    if (bodyText.length < 50) {
-                        console.log('Content too short:', bodyText.length);
-                        return false;
-                    }
-                    
-                    // Check for loading text or minimal content
-                    if (bodyText.toLowerCase().includes('loading') || 
-                        bodyText.toLowerCase().includes('please wait') ||
-                        bodyText.toLowerCase().includes('loading...') ||
-                        bodyText.toLowerCase().includes('yzi')) {  // The minimal title we saw
-                        console.log('Found loading text or minimal content');
-                        return false;
-                    }
-                    
-                    // Look for slide navigation elements (like "1/9")
-                    const hasSlideNumbers = bodyText.match(/\\d+\\s*\\/\\s*\\d+/);
-                    if (hasSlideNumbers) {
-                        console.log('Found slide numbers:', hasSlideNumbers[0]);
-                        return true;  // This is a good sign
-                    }
-                    
-                    // Check for presentation content
-                    const hasPresentationContent = bodyText.toLowerCase().includes('pitch') ||
-                        bodyText.toLowerCase().includes('presentation') ||
-                        bodyText.toLowerCase().includes('slide') ||
-                        bodyText.toLowerCase().includes('deck') ||
-                        bodyText.length > 500;  // Substantial content
-                    
-                    if (!hasPresentationContent) {
-                        console.log('No presentation content detected');
-                        return false;
-                    }
-                    
-                    // Check for images
-                    const images = document.querySelectorAll('img');
-                    let loadedImages = 0;
-                    for (let img of images) {
-                        if (img.complete && img.naturalWidth > 0) {
-                            loadedImages++;
-                        }
-                    }
-                    
-                    // Check for slide content
-                    const slideContent = document.querySelectorAll(
-                        '[class*="slide"], [class*="presentation"], [class*="content"], [class*="deck"]'
-                    );
-                    
-                    console.log('Content validation:', {
-                        textLength: bodyText.length,
-                        images: images.length,
-                        loadedImages: loadedImages,
-                        slideContent: slideContent.length,
-                        hasPresentationContent: hasPresentationContent,
-                        hasSlideNumbers: hasSlideNumbers ? hasSlideNumbers[0] : null
-                    });
-                    
-                    // More lenient validation - just need substantial content or slide numbers
-                    return bodyText.length > 200 || hasSlideNumbers;
-                }'''))
-                
-                if is_valid_content:
-                    logger.info(f"Slide {slide_number} content validated on attempt {attempt + 1}")
-                    break
-                else:
-                    logger.warning(f"Slide {slide_number} content not ready, attempt {attempt + 1}/{max_attempts}")
-                    if attempt < max_attempts - 1:
-                        self.loop.run_until_complete(asyncio.sleep(3))
-                    else:
-                        logger.warning(f"Slide {slide_number} content validation failed, capturing anyway")
+            logger.info("Capturing slide %d", slide_number)
+            
+            # Validate content before capture, waiting on the same checks if they fail
+            if await self.page.evaluate(SLIDE_CONTENT_READY_JS):
+                logger.info("Slide %d content validated", slide_number)
+            else:
+                logger.warning("Slide %d content not ready, waiting", slide_number)
+                try:
+                    # The check reads the page text, so poll it every 100ms rather than every frame
+                    await wait_for_page_function(self.page, SLIDE_CONTENT_READY_JS, SLIDE_CONTENT_MAX_MS, polling=100)
+                    logger.info("Slide %d content validated after waiting", slide_number)
+                except (asyncio.TimeoutError, PyppeteerError) as e:
+                    logger.warning("Slide %d content validation failed, capturing anyway: %s", slide_number, e)
             
             # Simulate human behavior before capture
-            self.loop.run_until_complete(self.page.mouse.move(
+            await self.page.mouse.move(
                 random.randint(200, 800), 
                 random.randint(200, 600)
-            ))
-            
-            # Small delay
-            self.loop.run_until_complete(asyncio.sleep(random.uniform(0.5, 1.5)))
+            )
             
             # Take screenshot
-            screenshot = self.loop.run_until_complete(self.page.screenshot({
-                'type': 'png',
-                'quality': 100,
-                'fullPage': False
-            }))
+            screenshot = await self._take_screenshot(self.page)
             
             # Validate screenshot content
             if len(screenshot) < 10000:  # Very small screenshot might be loading page
-                logger.warning(f"Slide {slide_number} screenshot seems too small ({len(screenshot)} bytes)")
+                logger.warning("Slide %d screenshot seems too small (%d bytes)", slide_number, len(screenshot))
             
-            logger.info(f"Captured slide {slide_number} ({len(screenshot)} bytes)")
+            logger.info("Captured slide %d (%d bytes)", slide_number, len(screenshot))
             return screenshot
             
         except Exception as e:
-            logger.error(f"Failed to capture slide {slide_number}: {e}")
+            logger.error("Failed to capture slide %d: %s", slide_number, e)
             return None
     
     def navigate_to_next_slide_sync(self) -> bool:
-        """Navigate to next slide with validation"""
+        """Advance the main page to the next slide"""
+        return self._run(self._navigate_to_next_slide())
+    
+    async def _navigate_to_next_slide(self) -> bool:
+        """
+        Navigate to next slide with validation. Returns False when there is no next slide:
+        the counter shows the last one, or it stays put after a retried press
+        """
         try:
             logger.info("Navigating to next slide...")
             
-            # Human-like delay before navigation
-            delay = random.uniform(1, 3)
-            self.loop.run_until_complete(asyncio.sleep(delay))
-            
             # Move mouse to center (human-like)
-            self.loop.run_until_complete(self.page.mouse.move(960, 540))
-            
-            # Small delay
-            self.loop.run_until_complete(asyncio.sleep(random.uniform(0.3, 0.8)))
-            
-            # Try multiple navigation methods
-            navigation_success = self.loop.run_until_complete(self.page.evaluate('''() => {
-                // Method 1: Try clicking next button
-                const nextButton = document.querySelector(
-                    '[data-testid*="next"], [aria-label*="next"], .next-slide, .slide-next, button[title*="next"]'
-                );
-                if (nextButton && !nextButton.disabled) {
-                    console.log('Clicking next button');
-                    nextButton.click();
-                    return true;
-                }
-                
-                // Method 2: Try arrow key
-                console.log('Using arrow key navigation');
-                return false; // Will use keyboard.press below
-            }'''))
+            await self.page.mouse.move(self.capture_width // 2, self.capture_height // 2)
             
-            if not navigation_success:
-                # Use arrow key navigation
-                self.loop.run_until_complete(self.page.keyboard.press('ArrowRight'))
+            if not await self._advance_slide(self.page):
+                return False
             
-            # Human-like delay after navigation
-            delay = random.uniform(2, 4)
-            self.loop.run_until_complete(asyncio.sleep(delay))
+            # Random mouse movement
+            await self.page.mouse.move(
+                random.randint(300, 700), 
+                random.randint(300, 500)
+            )
             
-            # Validate navigation was successful
-            navigation_validated = self.loop.run_until_complete(self.page.evaluate('''() => {
+            # Let the new slide paint before it is captured, and validate it in the same round trip
+            navigation_validated = await self.page.evaluate('''async () => {
+                await new Promise(resolve => requestAnimationFrame(() => requestAnimationFrame(resolve)));
+                
                 // Check if we're still on the same slide (navigation failed)
-                const bodyText = document.body.innerText.trim();
+                const bodyText = (document.querySelector('main, [role="main"]') || document.body).textContent.trim();
                 
                 // Check for error messages
                 if (bodyText.toLowerCase().includes('error') || 
@@ -1011,19 +1340,15 @@ class StealthPitchDownloader:
                 
                 // Check if content changed (simple check)
                 return bodyText.length > 50;
-            }'''))
+            }''')
             
             if not navigation_validated:
                 logger.warning("Navigation validation failed, trying alternative method")
                 # Try alternative navigation
-                self.loop.run_until_complete(self.page.keyboard.press('ArrowRight'))
-                self.loop.run_until_complete(asyncio.sleep(2))
-            
-            # Random mouse movement
-            self.loop.run_until_complete(self.page.mouse.move(
-                random.randint(300, 700), 
-                random.randint(300, 500)
-            ))
+                prev_idx = await self.page.evaluate('() => window.__slideIdx || 0')
+                await self._press_arrow_right(self.page)
+                await self._wait_for_slide_change(self.page, prev_idx)
+                await self.page.evaluate(NEXT_PAINT_JS)
             
             return True
             
@@ -1031,113 +1356,495 @@ class StealthPitchDownloader:
             logger.error(f"Navigation failed: {e}")
             return False
     
-    def create_pdf_from_screenshots(self, screenshots: List[bytes], filename: str) -> str:
-        """Create PDF from screenshots - synchronous method"""
+    async def _retry_next_slide(self):
+        """Press ArrowRight once more and wait for the DOM to settle, for decks without a counter"""
+        prev_mutations = await self.page.evaluate('() => window.__mutationCount || 0')
+        await self._press_arrow_right(self.page)
+        await self._settle_until(self.page, SLIDE_SETTLED_JS, prev_mutations, max_ms=SLIDE_SETTLE_MAX_MS)
+    
+    async def _advance_slide(self, page, settle: bool = False) -> bool:
+        """
+        Move page to the next slide and wait for it to change, and with settle also for
+        its DOM to settle. Returns False when there is no next slide: the counter shows
+        the last one, or it stays put after a retried press
+        """
+        # Remember the slide index (or DOM activity without a counter) to wait for it to
+        # advance, and try the next button, in one round trip
+        prev_idx, prev_mutations, navigation_success, at_end = await page.evaluate('''() => {
+            const prevIdx = window.__slideIdx || 0;
+            const prevMutations = window.__mutationCount || 0;
+            
+            // Nothing to navigate to when the counter already reads e.g. "9 / 9"
+            const counter = document.querySelector('.player-v2-chrome-controls-slide-count');
+            const position = counter && counter.textContent.match(/(\\d+)\\s*(?:\\/|of)\\s*(\\d+)/i);
+            if (position && Number(position[1]) >= Number(position[2])) {
+                return [prevIdx, prevMutations, false, true];
+            }
+            
+            // Method 1: Try clicking next button
+            const nextButton = document.querySelector(
+                '[data-testid*="next"], [aria-label*="next"], .next-slide, .slide-next, button[title*="next"]'
+            );
+            if (nextButton && !nextButton.disabled) {
+                console.log('Clicking next button');
+                nextButton.click();
+                return [prevIdx, prevMutations, true, false];
+            }
+            
+            // Method 2: Try arrow key
+            console.log('Using arrow key navigation');
+            return [prevIdx, prevMutations, false, false]; // Will use keyboard.press below
+        }''')
+        
+        if at_end:
+            logger.info("Slide counter shows the last slide")
+            return False
+        
+        if not navigation_success:
+            # Use arrow key navigation
+            await self._press_arrow_right(page)
+        
+        # Wait for the slide counter to change instead of a fixed delay. A press can be
+        # dropped while the player is busy, so one stall gets a second press
+        if prev_idx:
+            if not await self._wait_for_slide_change(page, prev_idx):
+                await self._press_arrow_right(page)
+                if not await self._wait_for_slide_change(page, prev_idx):
+                    logger.warning("Slide counter did not advance, assuming the last slide")
+                    return False
+            if settle:
+                await self._settle_until(page, SLIDE_SETTLED_JS, prev_mutations, max_ms=SLIDE_SETTLE_MAX_MS)
+        else:
+            await self._settle_until(page, SLIDE_SETTLED_JS, prev_mutations, max_ms=SLIDE_SETTLE_MAX_MS)
+        
+        return True
+    
+    async def _wait_for_slide_change(self, page, prev_idx: int, timeout_ms: int = 5000) -> bool:
+        """Wait until the slide tracker reports a slide past prev_idx"""
         try:
-            logger.info(f"Creating PDF from {len(screenshots)} screenshots...")
-
-            # Create temporary file
-            temp_fd, output_path = tempfile.mkstemp(suffix='.pdf')
-            os.close(temp_fd)
-
-            # Create PDF with landscape orientation
-            page_width, page_height = landscape(letter)
-            c = canvas.Canvas(output_path, pagesize=landscape(letter))
-
-            for i, screenshot_data in enumerate(screenshots):
-                logger.info(f"Adding slide {i+1} to PDF")
-
-                # Convert screenshot to image
-                img = Image.open(io.BytesIO(screenshot_data))
-
-                # Save as temporary file for ReportLab
-                temp_img_fd, temp_img_path = tempfile.mkstemp(suffix='.png')
-                os.close(temp_img_fd)
-                img.save(temp_img_path, 'PNG')
-
-                # Add to PDF (full page)
-                c.drawImage(temp_img_path, 0, 0, width=page_width, height=page_height)
-
-                # Clean up temp image
-                os.unlink(temp_img_path)
-
-                # New page for next slide (except last)
-                if i < len(screenshots) - 1:
-                    c.showPage()
-
-            c.save()
-            logger.info(f"PDF created: {output_path}")
-            return output_path
-
+            await wait_for_page_function(page, 'idx => window.__slideIdx > idx', timeout_ms, prev_idx)
+            return True
+        except (asyncio.TimeoutError, PyppeteerError) as e:
+            logger.warning("Slide change not detected: %s", e)
+            return False
+    
+    async def _settle_until(self, page, page_function: str, *args, max_ms: int = 300, step_ms: int = 20) -> bool:
+        """
+        Poll page_function every step_ms and return as soon as it is true, or False
+        after max_ms; a bounded replacement for a fixed sleep
+        """
+        deadline = time.monotonic() + max_ms / 1000
+        while True:
+            if await page.evaluate(page_function, *args):
+                return True
+            if time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(step_ms / 1000)
+    
+    def _capture_slides_sequential_sync(self, total_slides: int, start_time: float, output_path: str) -> int:
+        """Capture slides one by one on the main page, streaming each into the PDF at output_path"""
+        # Go to first slide
+        logger.info("Going to first slide...")
+        self._run(self.page.keyboard.press('Home'))
+        self._settle_sync(6000)
+        
+        return self._capture_to_pdf(
+            output_path, lambda pdf: self._run(self._capture_pipeline(total_slides, start_time, pdf))
+        )
+    
+    def _capture_vector_pdf_sync(self, total_slides: int, start_time: float, output_path: str) -> int:
+        """Print slides one by one with Chromium's PDF backend and merge them into output_path"""
+        from pypdf import PdfReader, PdfWriter
+        
+        logger.info("Going to first slide...")
+        self._run(self.page.keyboard.press('Home'))
+        self._settle_sync(6000)
+        
+        # Print the slides as they appear on screen, not with the deck's print styles.
+        # The page goes back to the pool, so the next download must not inherit this
+        self._run(self.page.emulateMedia('screen'))
+        try:
+            writer = PdfWriter()
+            for slide_num in range(1, total_slides + 1):
+                if self.shutdown_requested:
+                    logger.info("Shutdown requested during slide capture")
+                    break
+                
+                if time.monotonic() - start_time > self.timeout - 30:
+                    logger.warning(f"Approaching timeout, stopping at slide {slide_num}")
+                    break
+                
+                slide_pdf = self._run(self._print_slide(slide_num))
+                if slide_pdf:
+                    # Pages are appended as-is; nothing is rasterized
+                    writer.add_page(PdfReader(io.BytesIO(slide_pdf)).pages[0])
+                
+                if slide_num < total_slides and not self._run(self._navigate_to_next_slide()):
+                    logger.info(f"Stopping after slide {slide_num}")
+                    break
+        finally:
+            self._run(self.page.emulateMedia(None))
+        
+        if not writer.pages:
+            return 0
+        
+        try:
+            with open(output_path, 'wb') as f:
+                writer.write(f)
+        except Exception:
+            if os.path.exists(output_path):
+                os.unlink(output_path)
+            raise
+        return len(writer.pages)
+    
+    async def _print_slide(self, slide_number: int) -> Optional[bytes]:
+        """Print the current slide to a one-page PDF the size of the viewport"""
+        try:
+            await self.page.evaluate(NEXT_PAINT_JS)
+            slide_pdf = await self.page.pdf({
+                'printBackground': True,
+                'width': f'{self.capture_width}px',
+                'height': f'{self.capture_height}px',
+                'pageRanges': '1'
+            })
+            logger.info("Printed slide %d (%d bytes)", slide_number, len(slide_pdf))
+            return slide_pdf
+            
         except Exception as e:
-            logger.error(f"PDF creation failed: {e}")
+            logger.error("Failed to print slide %d: %s", slide_number, e)
+            return None
+    
+    def _capture_to_pdf(self, output_path: str, capture: Callable[[PdfImageWriter], None]) -> int:
+        """Run capture(pdf) against a PDF streamed to output_path and return its page count"""
+        page_width, page_height = PAGE_SIZE
+        try:
+            with open(output_path, 'wb') as f:
+                pdf = PdfImageWriter(f, page_width, page_height)
+                capture(pdf)
+                pdf.close()
+        except Exception:
+            os.unlink(output_path)
             raise
+        
+        if not pdf.page_count:
+            os.unlink(output_path)
+        return pdf.page_count
     
-    def close_browser_sync(self):
-        """Close browser synchronously with better error handling"""
-        if self.browser:
+    async def _capture_pipeline(self, total_slides: int, start_time: float, pdf: PdfImageWriter):
+        """Capture slides and write them to the PDF through a queue while navigation continues"""
+        queue = asyncio.Queue(maxsize=2)
+        loop = asyncio.get_running_loop()
+        
+        # Without a slide counter a stalled deck is only visible in the screenshots themselves
+        tracked = await self.page.evaluate('() => (window.__slideIdx || 0) > 0')
+        prev_thumbnail = None
+        
+        async def is_repeat(screenshot: bytes) -> bool:
+            nonlocal prev_thumbnail
+            thumbnail = await loop.run_in_executor(None, image_thumbnail, screenshot)
+            repeat = (prev_thumbnail is not None and
+                      thumbnail_difference(thumbnail, prev_thumbnail) <= DUPLICATE_SLIDE_MAX_PIXELS)
+            prev_thumbnail = thumbnail
+            return repeat
+        
+        async def producer():
             try:
-                logger.info("Closing browser...")
-                
-                # Check if loop is still running
-                if self.loop and not self.loop.is_closed():
-                    try:
-                        self.loop.run_until_complete(self.browser.close())
-                        logger.info("Browser closed successfully")
-                    except RuntimeError as e:
-                        if "This event loop is already running" in str(e):
-                            logger.warning("Event loop conflict during browser close, forcing close")
-                            # Force close without using the loop
-                            import subprocess
-                            try:
-                                subprocess.run(['pkill', '-f', 'chrome'], check=False)
-                            except:
-                                pass
-                        else:
-                            raise e
+                for slide_num in range(1, total_slides + 1):
+                    # Check for shutdown before each slide
+                    if self.shutdown_requested:
+                        logger.info("Shutdown requested during slide capture")
+                        break
+                    
+                    # Check timeout
+                    elapsed = time.monotonic() - start_time
+                    if elapsed > self.timeout - 30:  # Leave 30 seconds for PDF creation
+                        logger.warning(f"Approaching timeout, stopping at slide {slide_num}")
+                        break
+                    
+                    # Capture current slide
+                    screenshot = await self._capture_slide(slide_num)
+                    if screenshot and not tracked and await is_repeat(screenshot):
+                        # A dropped key press also repeats a slide, so only a repeat that
+                        # survives a second press means the deck has ended
+                        logger.info(f"Slide {slide_num} repeats the previous slide, pressing ArrowRight again")
+                        await self._retry_next_slide()
+                        screenshot = await self._capture_slide(slide_num)
+                        if screenshot and await is_repeat(screenshot):
+                            logger.info(f"Slide {slide_num} still repeats the previous slide, stopping")
+                            break
+                    if screenshot:
+                        await queue.put(screenshot)
+                    
+                    # Navigate to next slide right away (except for last slide), and stop
+                    # rather than capture the same slide again when there is no next one
+                    if slide_num < total_slides and not await self._navigate_to_next_slide():
+                        logger.info(f"Stopping after slide {slide_num}")
+                        break
+            except BaseException:
+                # The consumer may have failed and stopped reading, so never wait on the queue here
+                if not queue.full():
+                    queue.put_nowait(None)
+                raise
+            await queue.put(None)
+        
+        async def consumer():
+            while True:
+                screenshot = await queue.get()
+                if screenshot is None:
+                    break
+                # Write off the loop thread; only the current screenshot stays in memory
+                await loop.run_in_executor(None, lambda: pdf.add_image(embeddable_image(screenshot)))
+        
+        # If either side fails the other is cancelled, so the producer never keeps driving
+        # self.page after it has gone back to the pool
+        tasks = [asyncio.ensure_future(producer()), asyncio.ensure_future(consumer())]
+        try:
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        for task in tasks:
+            if not task.cancelled() and task.exception():
+                raise task.exception()
+    
+    async def _take_screenshot(self, page) -> bytes:
+        """Capture the viewport in self.image_format straight through CDP"""
+        # optimizeForSpeed picks Chrome's faster encoder settings; older builds ignore it
+        params = {'format': self.image_format, 'captureBeyondViewport': False, 'optimizeForSpeed': True}
+        if self.image_format == 'jpeg':
+            params['quality'] = self.screenshot_quality
+        
+        result = await page._client.send('Page.captureScreenshot', params)
+        return base64.b64decode(result['data'])
+    
+    async def _capture_range(self, url: str, lo: int, hi: int,
+                             on_slide: Callable[[int, bytes], Awaitable[None]]) -> Optional[int]:
+        """
+        Open the presentation in a new tab and pass slides lo..hi-1 to on_slide as they
+        are captured. Returns the slide count if the deck ends inside the range, else None
+        """
+        async with browser_pool.tab() as page:
+            await self._apply_capture_size(page)
+            page.setDefaultNavigationTimeout(self.nav_timeout_ms)
+            await page.goto(url, {'waitUntil': 'domcontentloaded'})
+            # Capturing a tab that never rendered would fill its range with loading screens;
+            # failing it gets the range captured again on the main page
+            if not await self._wait_for_presentation_ready(page, 30000):
+                raise RuntimeError(f"Presentation did not render in tab for slides {lo + 1}-{hi}")
+            return await self._capture_range_on(page, lo, hi, on_slide)
+    
+    async def _capture_range_on(self, page, lo: int, hi: int,
+                                on_slide: Callable[[int, bytes], Awaitable[None]]) -> Optional[int]:
+        """Step page to slide lo and capture slides lo..hi-1 (see _capture_range)"""
+        # Only burst on the slide tracker if this deck exposes a counter
+        tracked, start_mutations = await page.evaluate(
+            '() => [(window.__slideIdx || 0) > 0, window.__mutationCount || 0]'
+        )
+        
+        # Pitch.com ignores slide query parameters, so step to the range start
+        await page.keyboard.press('Home')
+        skipped = 0
+        if tracked and lo:
+            # Burst to the range start and wait once, then step over any presses the player dropped
+            await page.evaluate(NEXT_PAINT_JS)
+            start_idx = await page.evaluate('() => window.__slideIdx')
+            await self._press_arrow_right_burst(page, lo)
+            await self._wait_for_slide_change(page, start_idx + lo - 1)
+            # The tracker counts counter updates, and a player may fold two presses into
+            # one update, so step by the position the counter shows when it has one
+            position = await page.evaluate(SLIDE_POSITION_JS)
+            if position is None:
+                skipped = await page.evaluate('() => window.__slideIdx') - start_idx
+            else:
+                while position < lo + 1:
+                    if not await self._advance_slide(page):
+                        logger.info("Deck ends before slide %d, nothing to capture in tab", lo + 1)
+                        return position
+                    position = await page.evaluate(SLIDE_POSITION_JS)
+                if position != lo + 1:
+                    raise RuntimeError(f"Tab reached slide {position} instead of slide {lo + 1}")
+                skipped = lo
+        for _ in range(lo - skipped):
+            # An overestimated slide count leaves tail tabs with nothing to capture
+            if not await self._advance_slide(page):
+                logger.info("Deck ends before slide %d, nothing to capture in tab", lo + 1)
+                return lo
+        if lo:
+            await self._settle_until(page, SLIDE_SETTLED_JS, start_mutations, max_ms=SLIDE_SETTLE_MAX_MS)
+        
+        for slide_index in range(lo, hi):
+            if self.shutdown_requested:
+                logger.info("Shutdown requested during slide capture in tab")
+                return None
+            
+            # Stop at the last slide instead of capturing it again
+            if slide_index > lo and not await self._advance_slide(page, settle=True):
+                logger.info("Deck ends after slide %d, stopping tab", slide_index)
+                return slide_index
+            
+            # The counter can change before the slide has finished its transition, so the
+            # steps above wait for the DOM to settle; let the result paint before capture
+            await page.evaluate(NEXT_PAINT_JS)
+            if page is not self.page:
+                # A background tab only paints once it is brought to the front
+                await page._client.send('Target.activateTarget', {'targetId': page._target._targetId})
+            screenshot = await self._take_screenshot(page)
+            logger.info("Captured slide %d in tab (%d bytes)", slide_index + 1, len(screenshot))
+            await on_slide(slide_index, screenshot)
+        
+        return None
+    
+    def capture_slides_parallel_sync(self, url: str, total_slides: int, time_budget: float,
+                                     output_path: str) -> int:
+        """Capture slides concurrently across a pool of tabs, streaming each into the PDF at output_path"""
+        def capture(pdf: PdfImageWriter):
+            # One writer thread keeps appends serialized; leaving the block waits for the last write
+            with ThreadPoolExecutor(max_workers=1) as writer:
+                self._run(self._capture_parallel(url, total_slides, time_budget, pdf, writer))
+        
+        return self._capture_to_pdf(output_path, capture)
+    
+    async def _capture_parallel(self, url: str, total_slides: int, time_budget: float,
+                                pdf: PdfImageWriter, writer: ThreadPoolExecutor):
+        """
+        Split the deck into contiguous ranges, one per tab, and capture them concurrently.
+        Slides of a failed tab are captured again on the main page. The PDF never has a
+        gap: it is cut at the first missing slide, and RuntimeError raised if that is the first
+        """
+        pool_size = parallel_tab_count(total_slides)
+        chunk = -(-total_slides // pool_size)  # ceiling division
+        logger.info(f"Capturing {total_slides} slides across {pool_size} tabs...")
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + max(time_budget, 1)
+        captured = set()
+        
+        async def write_slide(slide_index: int, screenshot: bytes):
+            def write():
+                # Pages are written as they arrive; the page tree puts them back in slide order
+                pdf.add_image(embeddable_image(screenshot), slide_index)
+                captured.add(slide_index)
+            await loop.run_in_executor(writer, write)
+        
+        async def flush_writes():
+            # Writes of cancelled tabs may still be queued; the single writer thread runs them in order
+            await loop.run_in_executor(writer, lambda: None)
+        
+        ranges = [(lo, min(lo + chunk, total_slides)) for lo in range(0, total_slides, chunk)]
+        tasks = [asyncio.ensure_future(self._capture_range(url, lo, hi, write_slide)) for lo, hi in ranges]
+        done, pending = await asyncio.wait(tasks, timeout=max(time_budget, 1))
+        
+        if pending:
+            logger.warning(f"Approaching timeout, cancelling {len(pending)} tabs")
+            for task in pending:
+                task.cancel()
+            # Let cancelled tasks run their cleanup and close their tabs
+            await asyncio.gather(*pending, return_exceptions=True)
+        await flush_writes()
+        
+        if self.shutdown_requested:
+            raise RuntimeError('Shutdown requested')
+        
+        deck_end = total_slides
+        for (lo, hi), task in zip(ranges, tasks):
+            if task in pending:
+                continue
+            if task.exception():
+                logger.error("Failed to capture slides %d-%d in tab: %s", lo + 1, hi, task.exception())
+            elif task.result() is not None:
+                deck_end = min(deck_end, task.result())
+        
+        def missing_ranges():
+            gaps = []
+            for slide_index in range(deck_end):
+                if slide_index in captured:
+                    continue
+                if gaps and gaps[-1][1] == slide_index:
+                    gaps[-1][1] = slide_index + 1
                 else:
-                    logger.warning("Event loop is closed, forcing browser close")
-                    import subprocess
-                    try:
-                        subprocess.run(['pkill', '-f', 'chrome'], check=False)
-                    except:
-                        pass
-                
+                    gaps.append([slide_index, slide_index + 1])
+            return gaps
+        
+        # Tabs cancelled at the timeout leave no time to capture their slides again
+        if not pending:
+            for lo, hi in missing_ranges():
+                logger.info("Capturing slides %d-%d again on the main page", lo + 1, hi)
+                try:
+                    end = await asyncio.wait_for(
+                        self._capture_range_on(self.page, lo, hi, write_slide), deadline - loop.time()
+                    )
+                except Exception as e:
+                    logger.error("Failed to capture slides %d-%d on the main page: %s", lo + 1, hi, e)
+                    break
+                if end is not None:
+                    deck_end = min(deck_end, end)
+            await flush_writes()
+        
+        # Like the sequential path, keep the slides captured before the first gap
+        gaps = missing_ranges()
+        if gaps:
+            prefix = gaps[0][0]
+            if not prefix:
+                raise RuntimeError(f"Slide 1 of {deck_end} could not be captured")
+            logger.warning(f"Keeping the first {prefix} of {deck_end} slides; slide {prefix + 1} could not be captured")
+            pdf.truncate(prefix)
+    
+    def close_browser_sync(self):
+        """Return the page to the browser pool; the shared browser stays running"""
+        if self.page:
+            try:
+                logger.info("Releasing browser page...")
+                self._run(browser_pool.release(self.page))
             except Exception as e:
-                logger.warning(f"Error closing browser: {e}")
+                logger.warning(f"Error releasing browser page: {e}")
             finally:
                 self.browser = None
                 self.page = None
-                # Close the event loop safely
-                if hasattr(self, 'loop') and self.loop and not self.loop.is_closed():
-                    try:
-                        self.loop.close()
-                    except:
-                        pass
+    
+    @classmethod
+    def download_many(cls, urls: List[str], concurrency: int = BROWSER_POOL_SIZE, **options) -> List[Dict]:
+        """
+        Download several presentations, at most `concurrency` at a time, and return
+        their results in input order. Every URL is on pitch.com, so this one limit is
+        also the per-host limit; the default matches the browser pool so no download
+        waits for a page. options are passed to each downloader.
+        """
+        def download_one(url: str) -> Dict:
+            filename = sanitize_filename(get_presentation_title_from_url(url))
+            return cls(**options).download_presentation(url, filename)
+        
+        # Downloads block on the shared browser pool loop, so each runs in its own thread
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+            return list(executor.map(download_one, urls))
+    
+    def request_shutdown(self):
+        """Ask a running download to stop at its next checkpoint"""
+        self._shutdown_requested = True
+    
+    @property
+    def shutdown_requested(self) -> bool:
+        """True once this download or the whole process has been asked to stop"""
+        return self._shutdown_requested or shutdown_event.is_set()
     
     def download_presentation(self, url: str, filename: str) -> Dict:
         """Stealth download method with human-like behavior"""
         try:
-            import time
-            import signal
-            
-            # Set up signal handler for graceful shutdown
-            def signal_handler(signum, frame):
-                logger.info(f"Received signal {signum}, marking for shutdown")
-                self._shutdown_requested = True
-            
-            # Register signal handlers
-            signal.signal(signal.SIGTERM, signal_handler)
-            signal.signal(signal.SIGINT, signal_handler)
+            # Handlers are registered once per process and only from the main thread
+            # (see download_many)
+            if self.install_signal_handlers:
+                try:
+                    install_shutdown_handlers()
+                except (ValueError, RuntimeError) as e:
+                    logger.warning(f"Signal handlers not installed: {e}")
             
-            start_time = time.time()
+            start_time = time.monotonic()
             
             # Step 1: Launch stealth browser
             if not self.launch_browser_sync():
                 return {'success': False, 'error': 'Browser launch failed'}
             
             # Check for shutdown
-            if self._shutdown_requested:
+            if self.shutdown_requested:
                 return {'success': False, 'error': 'Shutdown requested'}
             
             # Step 2: Navigate to presentation
@@ -1145,7 +1852,7 @@ class StealthPitchDownloader:
                 return {'success': False, 'error': 'Navigation failed'}
             
             # Check for shutdown
-            if self._shutdown_requested:
+            if self.shutdown_requested:
                 return {'success': False, 'error': 'Shutdown requested'}
             
             # Step 3: Detect slides
@@ -1153,72 +1860,49 @@ class StealthPitchDownloader:
             logger.info(f"Will capture {total_slides} slides")
             
             # Check for shutdown
-            if self._shutdown_requested:
+            if self.shutdown_requested:
                 return {'success': False, 'error': 'Shutdown requested'}
             
-            # Step 4: Go to first slide
-            logger.info("Going to first slide...")
-            self.loop.run_until_complete(self.page.keyboard.press('Home'))
-            
-            # Human-like delay
-            self.loop.run_until_complete(asyncio.sleep(random.uniform(3, 6)))
-            
-            # Check for shutdown
-            if self._shutdown_requested:
-                return {'success': False, 'error': 'Shutdown requested'}
-            
-            # Step 5: Capture slides following the exact workflow
-            screenshots = []
-            
-            for slide_num in range(1, total_slides + 1):
-                # Check for shutdown before each slide
-                if self._shutdown_requested:
-                    logger.info("Shutdown requested during slide capture")
-                    break
-                
-                # Check timeout
-                elapsed = time.time() - start_time
-                if elapsed > self.timeout - 30:  # Leave 30 seconds for PDF creation
-                    logger.warning(f"Approaching timeout, stopping at slide {slide_num}")
-                    break
-                
-                # Capture current slide
-                screenshot = self.capture_slide_sync(slide_num)
-                if screenshot:
-                    screenshots.append(screenshot)
-                
-                # Navigate to next slide (except for last slide)
-                if slide_num < total_slides:
-                    self.navigate_to_next_slide_sync()
-            
-            if not screenshots:
-                return {'success': False, 'error': 'No slides captured'}
-            
-            # Step 6: Create PDF (synchronous)
-            pdf_path = self.create_pdf_from_screenshots(screenshots, filename)
-            
-            # Step 7: Save and return
+            # Step 4/5/6: Capture slides into a PDF next to its served location
             file_id = str(uuid.uuid4())
             saved_path = f"/tmp/{file_id}.pdf"
+            partial_path = f"{saved_path}.part"
+            
+            if self.vector_pdf:
+                slide_count = self._capture_vector_pdf_sync(total_slides, start_time, partial_path)
+            # A single tab would reload the deck only to capture it the way the main page,
+            # already positioned, captures it sequentially. Decks without a slide counter
+            # stay sequential too: only that path can tell a repeated last slide from a new one
+            elif (self.parallel_capture and total_slides >= PARALLEL_MIN_SLIDES and
+                  parallel_tab_count(total_slides) >= 2 and
+                  self._run(self.page.evaluate('() => (window.__slideIdx || 0) > 0'))):
+                time_budget = self.timeout - 30 - (time.monotonic() - start_time)  # Leave 30 seconds for PDF creation
+                # Tabs load the URL variant that rendered on the main page, not the one requested
+                slide_count = self.capture_slides_parallel_sync(self.page.url, total_slides, time_budget, partial_path)
+            else:
+                slide_count = self._capture_slides_sequential_sync(total_slides, start_time, partial_path)
+            
+            if not slide_count:
+                return {'success': False, 'error': 'No slides captured'}
             
-            import shutil
-            shutil.copy2(pdf_path, saved_path)
-            
-            # Read PDF data
-            with open(pdf_path, 'rb') as f:
-                pdf_data = f.read()
+            # Same filesystem, so the rename is atomic and never exposes a half-written PDF
+            os.replace(partial_path, saved_path)
             
-            # Clean up
-            os.unlink(pdf_path)
+            # Step 7: Encode the PDF straight from a read-only mapping, skipping a full-size read copy
+            pdf_base64 = None
+            if self.inline_base64:
+                with open(saved_path, 'rb') as f:
+                    with mmap.mmap(f.fileno(), 0, prot=mmap.PROT_READ) as pdf_map:
+                        pdf_base64 = base64.b64encode(pdf_map).decode('utf-8')
             
-            elapsed = time.time() - start_time
+            elapsed = time.monotonic() - start_time
             logger.info(f"Download completed in {elapsed:.1f} seconds")
             
             return {
                 'success': True,
                 'filename': f"{filename}.pdf",
-                'slides': len(screenshots),
-                'data': base64.b64encode(pdf_data).decode('utf-8'),
+                'slides': slide_count,
+                'data': pdf_base64,
                 'file_id': file_id,
                 'file_path': saved_path,
                 'processing_time': f"{elapsed:.1f}s"
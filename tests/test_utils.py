@@ -0,0 +1,137 @@
+import io
+
+import pytest
+from PIL import Image, ImageDraw, ImageFont
+from pypdf import PdfReader
+
+from utils import (
+    DUPLICATE_SLIDE_MAX_PIXELS, PdfImageWriter, can_embed_image, embeddable_image,
+    image_thumbnail, parse_slide_total, read_jpeg_info, thumbnail_difference,
+    validate_pitch_url
+)
+
+def make_slide(title: str, body: str = None, quality: int = 85) -> bytes:
+    """Render a mostly white 1280x720 text slide as JPEG, like a captured screenshot"""
+    image = Image.new('RGB', (1280, 720), 'white')
+    draw = ImageDraw.Draw(image)
+    draw.text((100, 80), title, fill=(30, 30, 30), font=ImageFont.load_default(size=56))
+    if body:
+        draw.text((100, 220), body, fill=(80, 80, 80), font=ImageFont.load_default(size=28))
+    buffer = io.BytesIO()
+    image.save(buffer, 'JPEG', quality=quality)
+    return buffer.getvalue()
+
+def slide_difference(a: bytes, b: bytes) -> int:
+    return thumbnail_difference(image_thumbnail(a), image_thumbnail(b))
+
+def test_recaptured_slide_is_a_repeat():
+    assert slide_difference(make_slide('Thank you'), make_slide('Thank you', quality=60)) <= DUPLICATE_SLIDE_MAX_PIXELS
+
+def test_white_text_slides_are_distinct():
+    pairs = [
+        (make_slide('Market opportunity', 'TAM of $4B growing 20% a year'),
+         make_slide('Our team', 'Founders from payments and design tools')),
+        (make_slide('Thank you'), make_slide('Questions?')),
+        (make_slide('Thank you'), make_slide('Thank you!')),
+        (make_slide('Q1'), make_slide('Q2'))
+    ]
+    for a, b in pairs:
+        assert slide_difference(a, b) > DUPLICATE_SLIDE_MAX_PIXELS
+
+def encode_image(image: Image.Image, image_format: str, **params) -> bytes:
+    buffer = io.BytesIO()
+    image.save(buffer, image_format, **params)
+    return buffer.getvalue()
+
+def write_pdf(images) -> bytes:
+    out = io.BytesIO()
+    writer = PdfImageWriter(out)
+    for image_data in images:
+        writer.add_image(embeddable_image(image_data))
+    writer.close()
+    return out.getvalue()
+
+def test_pdf_pages_read_back_with_pypdf():
+    jpeg = make_slide('Market opportunity')
+    rgba_png = encode_image(Image.new('RGBA', (320, 180), (200, 30, 30, 128)), 'PNG')
+    palette = Image.new('RGB', (320, 180), 'navy').convert('P')
+    palette_png = encode_image(palette, 'PNG')
+    assert not can_embed_image(rgba_png) and not can_embed_image(palette_png)
+    
+    reader = PdfReader(io.BytesIO(write_pdf([jpeg, rgba_png, palette_png])))
+    assert len(reader.pages) == 3
+    for page in reader.pages:
+        assert [float(value) for value in page.mediabox] == [0, 0, 792, 612]
+    
+    # The JPEG is embedded verbatim, the PNGs as decodable pixel data
+    jpeg_object = reader.pages[0]['/Resources']['/XObject']['/Im0'].get_object()
+    assert jpeg_object['/Filter'] == '/DCTDecode'
+    assert jpeg_object.get_data() == jpeg
+    assert reader.pages[1].images[0].image.size == (320, 180)
+    assert reader.pages[2].images[0].image.getpixel((0, 0)) == palette.convert('RGB').getpixel((0, 0))
+
+def test_pdf_xref_offsets_point_at_objects():
+    data = write_pdf([make_slide('Thank you'), make_slide('Questions?')])
+    startxref = int(data[data.rindex(b'startxref') + len(b'startxref'):].split()[0])
+    assert data[startxref:].startswith(b'xref\n')
+    
+    lines = data[startxref:].split(b'\n')
+    first, count = (int(value) for value in lines[1].split())
+    entries = lines[2:2 + count]
+    assert first == 0 and entries[0].startswith(b'0000000000 65535 f')
+    for object_id, entry in enumerate(entries[1:], start=1):
+        offset = int(entry.split()[0])
+        assert data[offset:].startswith(f'{object_id} 0 obj\n'.encode('ascii'))
+
+def test_pdf_truncate_keeps_page_prefix():
+    out = io.BytesIO()
+    writer = PdfImageWriter(out)
+    for position, title in [(2, 'Three'), (0, 'One'), (1, 'Two')]:
+        writer.add_image(make_slide(title), position)
+    writer.truncate(2)
+    writer.close()
+    assert writer.page_count == 2
+    assert len(PdfReader(io.BytesIO(out.getvalue())).pages) == 2
+
+def test_read_jpeg_info_progressive_and_truncated():
+    image = Image.new('RGB', (640, 360), 'white')
+    assert read_jpeg_info(encode_image(image, 'JPEG', progressive=True)) == (640, 360, 3)
+    assert read_jpeg_info(encode_image(image.convert('L'), 'JPEG')) == (640, 360, 1)
+    
+    jpeg = encode_image(image, 'JPEG')
+    sof = jpeg.index(b'\xff\xc0')
+    for length in (sof + 6, sof // 2):
+        with pytest.raises(ValueError):
+            read_jpeg_info(jpeg[:length])
+
+def test_parse_slide_total():
+    assert parse_slide_total('3 / 9') == 9
+    assert parse_slide_total('3/12') == 12
+    assert parse_slide_total('Slide 3 of 9') == 9
+    assert parse_slide_total('SLIDE 1 OF 20') == 20
+    # A zero total is skipped in favour of a later match
+    assert parse_slide_total('0 / 0 then 2 / 7') == 7
+    assert parse_slide_total('Our team') is None
+    assert parse_slide_total('') is None
+
+def test_validate_pitch_url_paths():
+    valid = [
+        'https://pitch.com/v/series-a-deck',
+        'https://app.pitch.com/v/series-a-deck/extra',
+        'https://pitch.com/public/0f1e2d3c-4b5a/9a8b-7c6d',
+        'https://app.pitch.com/app/public/player/0f1e2d3c-4b5a/9a8b-7c6d'
+    ]
+    invalid = [
+        'https://pitch.com/',
+        'https://pitch.com/v/',
+        'https://pitch.com/public/not-hex!/9a8b',
+        'https://pitch.com/app/public/player/0f1e2d3c',
+        'https://pitch.com/blog/v/deck',
+        'https://evil.com/v/series-a-deck',
+        'pitch.com/v/series-a-deck',
+        ''
+    ]
+    for url in valid:
+        assert validate_pitch_url(url), url
+    for url in invalid:
+        assert not validate_pitch_url(url), url
@@ -3,12 +3,27 @@
 Utility functions for Pitch.com Downloader API
 """
 
+import io
 import re
 import logging
+import struct
 import sys
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
 from urllib.parse import urlparse
 
+_PITCH_DOMAINS = frozenset({
+    'pitch.com',
+    'app.pitch.com',
+    'www.pitch.com'
+})
+
+# Valid Pitch.com URL paths, compiled once into a single alternation
+_PITCH_PATH_RE = re.compile(
+    r'/v/[^/]+'                                    # Classic: /v/presentation-name
+    r'|/public/[a-f0-9-]+/[a-f0-9-]+'              # Public: /public/uuid/uuid
+    r'|/app/public/player/[a-f0-9-]+/[a-f0-9-]+'   # App: /app/public/player/uuid/uuid
+)
+
 def validate_pitch_url(url: str) -> bool:
     """
     Validate if URL is a valid Pitch.com presentation URL
@@ -30,34 +45,26 @@ def validate_pitch_url(url: str) -> bool:
             return False
         
         # Check if it's a Pitch.com domain
-        valid_domains = [
-            'pitch.com',
-            'app.pitch.com',
-            'www.pitch.com'
-        ]
-        
-        if parsed.netloc not in valid_domains:
+        if parsed.netloc not in _PITCH_DOMAINS:
             return False
         
         # Check URL patterns
-        path = parsed.path
-        
-        # Valid Pitch.com URL patterns
-        patterns = [
-            r'^/v/[^/]+',                                    # Classic: /v/presentation-name
-            r'^/public/[a-f0-9-]+/[a-f0-9-]+',             # Public: /public/uuid/uuid
-            r'^/app/public/player/[a-f0-9-]+/[a-f0-9-]+'   # App: /app/public/player/uuid/uuid
-        ]
-        
-        for pattern in patterns:
-            if re.match(pattern, path):
-                return True
-        
-        return False
+        return _PITCH_PATH_RE.match(parsed.path) is not None
         
     except Exception as e:
         return False
 
+# Slide counter formats such as "3 / 9", "3 of 9" and "Slide 3 of 9"
+SLIDE_COUNTER_RE = re.compile(r'(\d+)\s*(?:/|of)\s*(\d+)', re.IGNORECASE)
+
+def parse_slide_total(text: str) -> Optional[int]:
+    """Extract the total slide count from slide counter text"""
+    for match in SLIDE_COUNTER_RE.finditer(text):
+        total = int(match.group(2))
+        if total > 0:
+            return total
+    return None
+
 def setup_logging():
     """Setup logging configuration"""
     logging.basicConfig(
@@ -124,3 +131,246 @@ def get_presentation_title_from_url(url: str) -> str:
     except Exception:
         return 'Pitch Presentation'
 
+
+
+# JPEG start-of-frame markers (baseline, progressive, lossless, arithmetic)
+_JPEG_SOF_MARKERS = {
+    0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7,
+    0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF
+}
+
+_JPEG_COLOR_SPACES = {
+    1: '/DeviceGray',
+    3: '/DeviceRGB',
+    4: '/DeviceCMYK'
+}
+
+def is_jpeg(data: bytes) -> bool:
+    """Check whether bytes start with a JPEG SOI marker"""
+    return data[:2] == b'\xff\xd8'
+
+def read_jpeg_info(data: bytes) -> Tuple[int, int, int]:
+    """
+    Read width, height and component count from a JPEG SOF marker
+    
+    Args:
+        data: Raw JPEG bytes
+        
+    Returns:
+        Tuple of (width, height, components)
+    """
+    offset = 2
+    while offset + 4 <= len(data):
+        if data[offset] != 0xFF:
+            offset += 1
+            continue
+        
+        marker = data[offset + 1]
+        if marker == 0xFF:
+            offset += 1
+            continue
+        
+        # Standalone markers carry no length field
+        if marker == 0x01 or 0xD0 <= marker <= 0xD7:
+            offset += 2
+            continue
+        
+        segment_length = struct.unpack_from('>H', data, offset + 2)[0]
+        if marker in _JPEG_SOF_MARKERS:
+            # A SOF cut off by truncation is reported like a missing one
+            if offset + 10 > len(data):
+                break
+            _, height, width, components = struct.unpack_from('>BHHB', data, offset + 4)
+            return width, height, components
+        
+        offset += 2 + segment_length
+    
+    raise ValueError('No SOF marker found in JPEG data')
+
+_PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# PNG color types that map onto a PDF color space without an alpha channel
+_PNG_COLOR_SPACES = {
+    0: ('/DeviceGray', 1),
+    2: ('/DeviceRGB', 3)
+}
+
+def _read_png_chunks(data: bytes) -> Optional[Tuple[int, int, str, int, List[memoryview]]]:
+    """
+    Parse a PNG whose compressed pixel data can be embedded in a PDF as-is, returning
+    its IDAT chunks as views into data. Only 8-bit, non-interlaced grayscale or RGB
+    PNGs qualify; anything with alpha or a palette needs decoding first.
+    """
+    if data[:8] != _PNG_SIGNATURE:
+        return None
+    
+    view = memoryview(data)
+    offset = 8
+    header = None
+    idat = []
+    while offset + 8 <= len(data):
+        length, chunk_type = struct.unpack_from('>I4s', data, offset)
+        chunk_data = view[offset + 8:offset + 8 + length]
+        if chunk_type == b'IHDR':
+            header = struct.unpack_from('>IIBBBBB', chunk_data)
+        elif chunk_type == b'IDAT':
+            idat.append(chunk_data)
+        elif chunk_type == b'IEND':
+            break
+        offset += 12 + length
+    
+    if not header or not idat:
+        return None
+    
+    width, height, bit_depth, color_type, _, _, interlace = header
+    if bit_depth != 8 or interlace != 0 or color_type not in _PNG_COLOR_SPACES:
+        return None
+    
+    color_space, colors = _PNG_COLOR_SPACES[color_type]
+    return width, height, color_space, colors, idat
+
+def can_embed_image(data: bytes) -> bool:
+    """Check whether image bytes can be embedded in a PDF without re-encoding"""
+    return is_jpeg(data) or _read_png_chunks(data) is not None
+
+def embeddable_image(data: bytes) -> bytes:
+    """Return image bytes PdfImageWriter can embed, converting to an RGB PNG if needed"""
+    if can_embed_image(data):
+        return data
+    from PIL import Image
+    buffer = io.BytesIO()
+    Image.open(io.BytesIO(data)).convert('RGB').save(buffer, 'PNG')
+    return buffer.getvalue()
+
+# Screenshots whose thumbnails differ in at most this many pixels show the same slide.
+# Re-captures of one slide differ in none; a changed word on a white slide in about ten
+DUPLICATE_SLIDE_MAX_PIXELS = 2
+
+def image_thumbnail(data: bytes, size: Tuple[int, int] = (160, 90)) -> bytes:
+    """
+    Decode image bytes to a small grayscale thumbnail, one byte per pixel. Slides
+    are mostly white, so comparing thumbnails pixel by pixel (see thumbnail_difference)
+    tells apart text-only slides that a 64-bit perceptual hash reads as identical.
+    """
+    from PIL import Image
+    
+    image = Image.open(io.BytesIO(data))
+    # JPEG decodes at 1/8 scale or smaller straight from the DCT data
+    image.draft('L', size)
+    return image.convert('L').resize(size, Image.BILINEAR).tobytes()
+
+def thumbnail_difference(a: bytes, b: bytes, min_delta: int = 32) -> int:
+    """Count the pixels whose brightness differs by more than min_delta between two thumbnails"""
+    return sum(1 for x, y in zip(a, b) if abs(x - y) > min_delta)
+
+def _image_xobject(data: bytes) -> Tuple[str, List[bytes]]:
+    """Build the image XObject dictionary and the stream parts for JPEG or PNG bytes"""
+    if is_jpeg(data):
+        width, height, components = read_jpeg_info(data)
+        color_space = _JPEG_COLOR_SPACES.get(components, '/DeviceRGB')
+        return (
+            f"<< /Type /XObject /Subtype /Image /Width {width} /Height {height} "
+            f"/ColorSpace {color_space} /BitsPerComponent 8 /Filter /DCTDecode "
+            f"/Length {len(data)} >>",
+            [data]
+        )
+    
+    # IDAT chunks are written one after another as views into data, never joined
+    png = _read_png_chunks(data)
+    if png is None:
+        raise ValueError('Unsupported image format for direct PDF embedding')
+    
+    # PNG IDAT data is a zlib stream with per-row predictors, which PDF decodes natively
+    width, height, color_space, colors, idat = png
+    return (
+        f"<< /Type /XObject /Subtype /Image /Width {width} /Height {height} "
+        f"/ColorSpace {color_space} /BitsPerComponent 8 /Filter /FlateDecode "
+        f"/DecodeParms << /Predictor 15 /Colors {colors} /BitsPerComponent 8 /Columns {width} >> "
+        f"/Length {sum(len(chunk) for chunk in idat)} >>",
+        idat
+    )
+
+class PdfImageWriter:
+    """
+    Write a PDF with one full-page image per page, one page at a time
+    
+    Each image is written to the output as soon as it is added, so only the
+    current image needs to stay in memory. Pages may be added out of order by
+    passing their position; the page tree written by close() puts them in
+    order. JPEGs are embedded verbatim as /DCTDecode streams and PNGs as their
+    original /FlateDecode pixel data (see _read_png_chunks), so no image is re-encoded.
+    """
+    
+    # Object 1 is the catalog and object 2 the page tree, written on close()
+    _CATALOG_ID = 1
+    _PAGES_ID = 2
+    
+    def __init__(self, output, page_width: float = 792, page_height: float = 612):
+        self.output = output
+        self.page_width = page_width
+        self.page_height = page_height
+        self._pages = []  # (position, page object id)
+        self._offsets = {}
+        self._position = 0
+        self._next_id = 3
+        
+        self._write(b'%PDF-1.4\n%\xe2\xe3\xcf\xd3\n')
+        self._write_object(self._CATALOG_ID, f"<< /Type /Catalog /Pages {self._PAGES_ID} 0 R >>".encode('ascii'))
+    
+    def _write(self, data: bytes):
+        self.output.write(data)
+        self._position += len(data)
+    
+    def _write_object(self, object_id: int, body: bytes, stream: List[bytes] = None):
+        self._offsets[object_id] = self._position
+        self._write(f"{object_id} 0 obj\n".encode('ascii'))
+        self._write(body)
+        if stream is not None:
+            self._write(b'\nstream\n')
+            for part in stream:
+                self._write(part)
+            self._write(b'\nendstream')
+        self._write(b'\nendobj\n')
+    
+    @property
+    def page_count(self) -> int:
+        return len(self._pages)
+    
+    def add_image(self, image_data: bytes, position: Optional[int] = None):
+        """Add a page showing a JPEG or PNG image (see can_embed_image), appended unless position is given"""
+        image_dict, image_stream = _image_xobject(image_data)
+        image_id, content_id, page_id = self._next_id, self._next_id + 1, self._next_id + 2
+        self._next_id += 3
+        
+        self._write_object(image_id, image_dict.encode('ascii'), image_stream)
+        
+        content = f"q {self.page_width:g} 0 0 {self.page_height:g} 0 0 cm /Im0 Do Q".encode('ascii')
+        self._write_object(content_id, f"<< /Length {len(content)} >>".encode('ascii'), [content])
+        
+        self._write_object(
+            page_id,
+            f"<< /Type /Page /Parent {self._PAGES_ID} 0 R "
+            f"/MediaBox [0 0 {self.page_width:g} {self.page_height:g}] "
+            f"/Resources << /XObject << /Im0 {image_id} 0 R >> >> "
+            f"/Contents {content_id} 0 R >>".encode('ascii')
+        )
+        self._pages.append((len(self._pages) if position is None else position, page_id))
+    
+    def truncate(self, page_count: int):
+        """Drop the pages at position page_count and later; their objects stay in the file unreferenced"""
+        self._pages = [(position, page_id) for position, page_id in self._pages if position < page_count]
+    
+    def close(self):
+        """Write the page tree, cross-reference table and trailer"""
+        kids = ' '.join(f"{page_id} 0 R" for _, page_id in sorted(self._pages))
+        self._write_object(
+            self._PAGES_ID,
+            f"<< /Type /Pages /Kids [{kids}] /Count {len(self._pages)} >>".encode('ascii')
+        )
+        
+        xref_offset = self._position
+        size = self._next_id
+        xref = [f"xref\n0 {size}\n", '0000000000 65535 f \n']
+        xref.extend(f"{self._offsets[object_id]:010d} 00000 n \n" for object_id in range(1, size))
+        xref.append(f"trailer\n<< /Size {size} /Root {self._CATALOG_ID} 0 R >>\nstartxref\n{xref_offset}\n%%EOF\n")
+        self._write(''.join(xref).encode('ascii'))